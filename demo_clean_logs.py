@@ -3,17 +3,28 @@
 Demo script showing clean, readable logs for risk management system.
 """
 
-import logging
+import os
 import time
 
-# Configure logging with timestamps - INFO level for clean readable logs
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s.%(msecs)03d | %(levelname)s | %(message)s",
-    datefmt="%H:%M:%S"
-)
+from fast_log import close, get_logger
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+# Demo pacing: 0 (default) runs the demo flat out for CI/smoke use;
+# DEMO_PACE=0.1 reproduces the original hand-paced output.
+PACE = float(os.getenv("DEMO_PACE", "0"))
+_next_tick = time.monotonic()
+
+
+def _pace() -> None:
+    """Sleep against a monotonic deadline so pacing doesn't drift."""
+    global _next_tick
+    if not PACE:
+        return
+    _next_tick += PACE
+    delay = _next_tick - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
 
 def demo_clean_logs():
     """Demo the clean logging output."""
@@ -23,20 +34,20 @@ def demo_clean_logs():
 
     # Simulate the clean logs you would see
     logger.info("🔗 Initializing TradingSuite for event listening...")
-    time.sleep(0.1)
+    _pace()
 
     logger.info("🔗 Registering risk rule event handlers...")
     logger.info("📡 Suite-level event handlers registered")
     logger.info("📡 Direct registration with MNQ PositionManager")
     logger.info("✅ Risk rules registered and monitoring live events")
-    time.sleep(0.1)
+    _pace()
 
     logger.info("✅ TradingSuite initialized and event handlers registered")
     logger.info("🛡️ Risk rules active: 1 rules loaded")
     logger.info("   📋 Rule loaded: {'rule_name': 'max_contracts', 'enabled': True, 'max_size': 2, 'severity': 'high', 'auto_flatten': False, 'breach_count': 0}")
     logger.info("🎧 Ready to receive real-time events from broker...")
     logger.info("🔗 WebSocket/SignalR: CONNECTED")
-    time.sleep(0.1)
+    _pace()
 
     # Simulate trade activity
     logger.info("📊 SESSION SUMMARY | Total Events: 1")
@@ -45,7 +56,7 @@ def demo_clean_logs():
     logger.info("   P&L Updates: 0")
     logger.info("   Confirmed Position: FLAT")
     logger.info("🛡️ Risk monitoring active: 1 rules ready (waiting for events)")
-    time.sleep(0.1)
+    _pace()
 
     # Simulate a position opening
     logger.info("📈 TRADE_EXECUTED | 14:30:15.123")
@@ -54,14 +65,14 @@ def demo_clean_logs():
     logger.info("   Position: 0 → 5")
     logger.info("   Avg Price: $24738.75")
     logger.info("   Total Trades: 1")
-    time.sleep(0.1)
+    _pace()
 
     # Simulate risk rule evaluation
     logger.info("📏 Position size check: MNQ = 5 contracts")
     logger.info("⚖️ Risk rules evaluated: 1 rules checked, 1 breaches found")
     logger.info("🚨 RISK BREACHES DETECTED: 1 rules triggered")
     logger.info("   Rule: MaxContractsRule | Config: {'rule_name': 'max_contracts', 'enabled': True, 'max_size': 2, 'severity': 'high', 'auto_flatten': False, 'breach_count': 1}")
-    time.sleep(0.1)
+    _pace()
 
     # Simulate manual close
     logger.info("📉 MANUAL_POSITION_CLOSED | 14:30:20.456")
@@ -69,13 +80,13 @@ def demo_clean_logs():
     logger.info("   Final Size: 0 (confirmed flat)")
     logger.info("   Previous Position: LONG 5")
     logger.info("   Ignoring reopen events for 3.0s")
-    time.sleep(0.1)
+    _pace()
 
     # Simulate stale execution filtering
     logger.info("📜 STALE_EXECUTION_IGNORED | Order 1643278299 | 0.8s after manual close")
     logger.info("   This order fill is likely from before manual close - ignoring for position tracking")
     logger.info("   Confirmed position remains: FLAT")
-    time.sleep(0.1)
+    _pace()
 
     # Final summary
     logger.info("📊 SESSION SUMMARY | Total Events: 3")
@@ -85,6 +96,10 @@ def demo_clean_logs():
     logger.info("   Confirmed Position: FLAT")
     logger.info("   Risk Breaches: 1 rules triggered")
 
+    # Flush the async writer before the closing banners so the simulated
+    # logs actually appear above them
+    close()
+
     print("\n" + "="*70)
     print("✅ LOGS ARE NOW CLEAN AND READABLE!")
     print("✅ No HTTP debug noise")
@@ -94,4 +109,7 @@ def demo_clean_logs():
     print("="*70)
 
 if __name__ == "__main__":
-    demo_clean_logs()
+    try:
+        demo_clean_logs()
+    finally:
+        close()
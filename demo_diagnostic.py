@@ -5,10 +5,35 @@ Demo of Risk Management Diagnostic System
 Shows what the diagnostic output looks like without requiring live trading.
 """
 
+import sys
 import time
 from datetime import datetime
 from typing import Any, Dict
 
+import orjson
+
+# Cached once so the option OR isn't paid per call
+_ORJSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+_TS_SECOND = 0
+_TS_PREFIX = ""
+
+
+def _ts() -> str:
+    """Wall-clock HH:MM:SS.mmm without building a datetime per call.
+
+    Caches the strftime-free per-second prefix so only the millisecond
+    suffix is recomputed between ticks.
+    """
+    global _TS_SECOND, _TS_PREFIX
+    ns = time.time_ns()
+    s = ns // 1_000_000_000
+    if s != _TS_SECOND:
+        lt = time.localtime(s)
+        _TS_PREFIX = "%02d:%02d:%02d." % (lt.tm_hour, lt.tm_min, lt.tm_sec)
+        _TS_SECOND = s
+    return _TS_PREFIX + "%03d" % ((ns // 1_000_000) % 1000)
+
 
 class DemoDiagnosticLogger:
     """Demo diagnostic logging system."""
@@ -17,54 +42,41 @@ class DemoDiagnosticLogger:
         self.event_counter = 0
         self.api_counter = 0
 
+    _KINDS = {
+        "EVENT": ("🎯 EVENT FIRED", "📦 PAYLOAD", "event_counter"),
+        "HOOK": ("🪝 HOOK FIRED", "📊 DATA", "event_counter"),
+        "API_CALL": ("🔌 API CALL", "⚙️ PARAMETERS", "api_counter"),
+        "RISK_RULE": ("🛡️ RULE EVAL", "📋 EVALUATION", "event_counter"),
+    }
+
+    def _log(self, kind: str, name: str, data: Dict[str, Any]):
+        """Single emission path shared by all four log_* wrappers."""
+        header, label, counter_attr = self._KINDS[kind]
+        setattr(self, counter_attr, getattr(self, counter_attr) + 1)
+        print(f"\n{header} [{_ts()}]: {name}")
+        print(f"   {label}:")
+        self._format_payload(data, "     ")
+
     def log_event(self, event_type: str, enum_name: str, payload: Dict[str, Any]):
         """Log when an event enum fires."""
-        self.event_counter += 1
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-
-        print(f"\n🎯 EVENT FIRED [{timestamp}]: {event_type} ({enum_name})")
-        print("   📦 PAYLOAD:")
-        self._format_payload(payload, "     ")
+        self._log("EVENT", f"{event_type} ({enum_name})", payload)
 
     def log_hook(self, hook_name: str, data: Dict[str, Any]):
         """Log when a hook fires."""
-        self.event_counter += 1
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-
-        print(f"\n🪝 HOOK FIRED [{timestamp}]: {hook_name}")
-        print("   📊 DATA:")
-        self._format_payload(data, "     ")
+        self._log("HOOK", hook_name, data)
 
     def log_api_call(self, method_name: str, parameters: Dict[str, Any]):
         """Log when an API call is made."""
-        self.api_counter += 1
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-
-        print(f"\n🔌 API CALL [{timestamp}]: {method_name}")
-        print("   ⚙️ PARAMETERS:")
-        self._format_payload(parameters, "     ")
+        self._log("API_CALL", method_name, parameters)
 
     def log_risk_rule(self, rule_name: str, evaluation: Dict[str, Any]):
         """Log risk rule evaluation."""
-        self.event_counter += 1
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-
-        print(f"\n🛡️ RULE EVAL [{timestamp}]: {rule_name}")
-        print("   📋 EVALUATION:")
-        self._format_payload(evaluation, "     ")
+        self._log("RISK_RULE", rule_name, evaluation)
 
     def _format_payload(self, payload: Any, indent: str = ""):
-        """Format payload data for display."""
-        if isinstance(payload, dict):
-            for key, value in payload.items():
-                if isinstance(value, dict):
-                    print(f"{indent}{key}:")
-                    for k, v in value.items():
-                        print(f"{indent}  {k}: {v}")
-                else:
-                    print(f"{indent}{key}: {value}")
-        else:
-            print(f"{indent}{payload}")
+        """Serialize payload data for display via orjson's C serializer."""
+        sys.stdout.buffer.write(orjson.dumps(payload, option=_ORJSON_OPTS, default=str))
+        sys.stdout.buffer.write(b"\n")
 
     def generate_report(self):
         """Generate diagnostic report."""
@@ -9,22 +9,94 @@ Shows complete event-to-API trace for debugging risk rules:
 """
 
 import asyncio
+import functools
+import io
+import operator
+import os
+import signal
+import sys
 import time
-from typing import Any, Dict, List
+from collections import Counter, deque
+from typing import Any, Dict, List, Mapping
 from dataclasses import dataclass
 from datetime import datetime
 
+import orjson
+
 from project_x_py import TradingSuite, EventType
+from fast_log import close
 from rules.rule_engine import RuleEngine, RiskEventHandler
 
 
-@dataclass
+# Cached once so the option OR isn't paid per call
+_ORJSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+_TS_SECOND = 0
+_TS_PREFIX = ""
+
+# Interned entry-type literals: one shared str object per kind, so the
+# thousands of ring-buffer entries don't each hold their own copy.
+_EVENT = sys.intern("EVENT")
+_HOOK = sys.intern("HOOK")
+_API_CALL = sys.intern("API_CALL")
+_RISK_RULE = sys.intern("RISK_RULE")
+
+# Single C-level extraction for the common event shapes; the except branch
+# falls back to per-attribute getattr probing for partial events.
+_ORDER_ATTRS = operator.attrgetter("order_id", "contractId", "side", "quantity", "price")
+_POS_ATTRS = operator.attrgetter("contractId", "size", "type", "averagePrice")
+
+_REQUIRED_ENV = ("PROJECT_X_API_KEY", "PROJECT_X_USERNAME", "PROJECT_X_ACCOUNT_NAME")
+
+# (header, payload label, counter attr, per-name Counter attr) per entry kind
+_KINDS = {
+    _EVENT: ("🎯 EVENT FIRED", "📦 PAYLOAD", "event_counter", "event_name_counts"),
+    _HOOK: ("🪝 HOOK FIRED", "📊 DATA", "event_counter", "hook_name_counts"),
+    _API_CALL: ("🔌 API CALL", "⚙️ PARAMETERS", "api_counter", "api_name_counts"),
+    _RISK_RULE: ("🛡️ RULE EVAL", "📋 EVALUATION", "event_counter", None),
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _make_formatter(shape, indent):
+    """Compile a straight-line formatter for a fixed flat payload shape.
+
+    The hot payloads (position_data, order_data, breach_data) have a small
+    set of static shapes, so each shape pays the isinstance dispatch once
+    at compile time instead of per key per event.
+    """
+    body = "".join(
+        "    w(%r + str(d[%r]) + %r)\n" % (f"{indent}{key}: ", key, "\n")
+        for key in shape
+    ) or "    pass\n"
+    namespace = {}
+    exec(f"def _fmt(d, w):\n{body}", namespace)
+    return namespace["_fmt"]
+
+
+def _ts() -> str:
+    """Wall-clock HH:MM:SS.mmm without building a datetime per call.
+
+    Caches the strftime-free per-second prefix so only the millisecond
+    suffix is recomputed between ticks.
+    """
+    global _TS_SECOND, _TS_PREFIX
+    ns = time.time_ns()
+    s = ns // 1_000_000_000
+    if s != _TS_SECOND:
+        lt = time.localtime(s)
+        _TS_PREFIX = "%02d:%02d:%02d." % (lt.tm_hour, lt.tm_min, lt.tm_sec)
+        _TS_SECOND = s
+    return _TS_PREFIX + "%03d" % ((ns // 1_000_000) % 1000)
+
+
+@dataclass(slots=True)
 class DiagnosticEntry:
     """Single diagnostic log entry."""
     timestamp: str
     entry_type: str  # EVENT, HOOK, API_CALL, RISK_RULE
     name: str
-    data: Dict[str, Any]
+    data: Mapping[str, Any]
     sequence: int
 
 
@@ -32,177 +104,150 @@ class DiagnosticLogger:
     """Comprehensive diagnostic logging system."""
 
     def __init__(self):
-        self.log_entries: List[DiagnosticEntry] = []
+        # Bounded ring buffer: oldest entries drop automatically, so memory
+        # stays constant however long the diagnostic session runs.
+        self.log_entries: deque[DiagnosticEntry] = deque(
+            maxlen=int(os.getenv("DIAG_RING", "4096"))
+        )
+        self.type_counts: Counter[str] = Counter()
+        # Per-name breakdowns maintained at log time so generate_report is
+        # O(#categories) instead of rescanning the ring buffer per section.
+        self.event_name_counts: Counter[str] = Counter()
+        self.hook_name_counts: Counter[str] = Counter()
+        self.api_name_counts: Counter[str] = Counter()
         self.event_counter = 0
         self.api_counter = 0
+        # Accumulate each multi-line log block here and flush it with a
+        # single write() instead of one syscall per line.
+        self._buf = io.StringIO()
+        # Entries are always recorded for the report; the formatted block is
+        # only built when someone is watching (tty) or verbosity is forced.
+        self.enabled = True
+        self._verbose = sys.stdout.isatty() or bool(os.getenv("DIAG_VERBOSE"))
+        # High-rate event types are sampled 1-in-K: every firing is still
+        # counted for the report, but only sampled ones pay for entry
+        # storage and formatting. Breaches/hooks/API calls are never
+        # sampled - they are rare and high-value.
+        self._sample_every = {
+            "POSITION_PNL_UPDATE": 100,
+            "POSITION_UPDATED": 10,
+        }
+
+    def _flush(self):
+        """Emit the accumulated block in one stdout write."""
+        sys.stdout.write(self._buf.getvalue())
+        self._buf.seek(0)
+        self._buf.truncate()
+
+    def _log(self, kind: str, name: str, data: Mapping[str, Any], name_key: str = None):
+        """Record one diagnostic entry; all four public log_* calls land here.
+
+        Single implementation means sampling, interning, ring-buffer
+        bounding and formatter caching apply uniformly to every kind.
+        """
+        header, label, counter_attr, name_counts_attr = _KINDS[kind]
+        sequence = getattr(self, counter_attr) + 1
+        setattr(self, counter_attr, sequence)
+        self.type_counts[kind] += 1
+        if name_counts_attr is not None:
+            name_counts = getattr(self, name_counts_attr)
+            key = name_key if name_key is not None else name
+            name_counts[key] += 1
+            every = self._sample_every.get(key, 1)
+            if every > 1 and name_counts[key] % every:
+                return
 
-    def log_event(self, event_type: str, enum_name: str, payload: Dict[str, Any]):
-        """Log when an event enum fires."""
-        self.event_counter += 1
         entry = DiagnosticEntry(
-            timestamp=datetime.now().strftime("%H:%M:%S.%f")[:-3],
-            entry_type="EVENT",
-            name=f"{event_type} ({enum_name})",
-            data=payload,
-            sequence=self.event_counter
+            timestamp=_ts(),
+            entry_type=kind,
+            name=name,
+            data=data,
+            sequence=sequence
         )
         self.log_entries.append(entry)
 
-        print(f"\n🎯 EVENT FIRED [{entry.timestamp}]: {event_type} ({enum_name})")
-        print("   📦 PAYLOAD:")
-        self._format_payload(payload, "     ")
+        if not self._verbose:
+            return
+        write = self._buf.write
+        write(f"\n{header} [{entry.timestamp}]: {name}\n")
+        write(f"   {label}:\n")
+        self._format_payload(data, "     ", write)
+        self._flush()
+
+    def log_event(self, event_type: str, enum_name: str, payload: Dict[str, Any]):
+        """Log when an event enum fires (high-rate types are sampled)."""
+        self._log(_EVENT, f"{event_type} ({enum_name})", payload, name_key=event_type)
 
     def log_hook(self, hook_name: str, data: Dict[str, Any]):
         """Log when a hook fires."""
-        self.event_counter += 1
-        entry = DiagnosticEntry(
-            timestamp=datetime.now().strftime("%H:%M:%S.%f")[:-3],
-            entry_type="HOOK",
-            name=hook_name,
-            data=data,
-            sequence=self.event_counter
-        )
-        self.log_entries.append(entry)
-
-        print(f"\n🪝 HOOK FIRED [{entry.timestamp}]: {hook_name}")
-        print("   📊 DATA:")
-        self._format_payload(data, "     ")
+        self._log(_HOOK, hook_name, data)
 
     def log_api_call(self, method_name: str, parameters: Dict[str, Any]):
         """Log when an API call is made."""
-        self.api_counter += 1
-        entry = DiagnosticEntry(
-            timestamp=datetime.now().strftime("%H:%M:%S.%f")[:-3],
-            entry_type="API_CALL",
-            name=method_name,
-            data=parameters,
-            sequence=self.api_counter
-        )
-        self.log_entries.append(entry)
-
-        print(f"\n🔌 API CALL [{entry.timestamp}]: {method_name}")
-        print("   ⚙️ PARAMETERS:")
-        self._format_payload(parameters, "     ")
+        self._log(_API_CALL, method_name, parameters)
 
     def log_risk_rule(self, rule_name: str, evaluation: Dict[str, Any]):
         """Log risk rule evaluation."""
-        self.event_counter += 1
-        entry = DiagnosticEntry(
-            timestamp=datetime.now().strftime("%H:%M:%S.%f")[:-3],
-            entry_type="RISK_RULE",
-            name=rule_name,
-            data=evaluation,
-            sequence=self.event_counter
-        )
-        self.log_entries.append(entry)
+        self._log(_RISK_RULE, rule_name, evaluation)
 
-        print(f"\n🛡️ RULE EVAL [{entry.timestamp}]: {rule_name}")
-        print("   📋 EVALUATION:")
-        self._format_payload(evaluation, "     ")
+    def _format_payload(self, payload: Any, indent: str = "", write=None):
+        """Serialize payload data into the buffer (or any write callable).
 
-    def _format_payload(self, payload: Any, indent: str = ""):
-        """Format payload data for display."""
+        Delegates to orjson's C serializer instead of recursing through the
+        payload with Python-level isinstance branches and per-key writes.
+        """
+        if write is None:
+            write = self._buf.write
         if isinstance(payload, dict):
-            for key, value in payload.items():
-                if isinstance(value, (dict, list)):
-                    print(f"{indent}{key}:")
-                    if isinstance(value, dict):
-                        for k, v in value.items():
-                            print(f"{indent}  {k}: {v}")
-                    else:
-                        print(f"{indent}  [{len(value)} items]")
-                else:
-                    print(f"{indent}{key}: {value}")
-        else:
-            print(f"{indent}{payload}")
+            values = payload.values()
+            if not any(isinstance(v, (dict, list)) for v in values):
+                # Flat, fixed-shape payload: use the compiled formatter
+                _make_formatter(tuple(payload), indent)(payload, write)
+                return
+        write(orjson.dumps(payload, option=_ORJSON_OPTS, default=str).decode())
+        write("\n")
 
     def generate_report(self):
-        """Generate comprehensive diagnostic report."""
+        """Generate comprehensive diagnostic report.
+
+        All tallies are maintained incrementally at log time, so this runs
+        in O(#categories) no matter how many entries the session produced -
+        there is no per-entry reduction left to vectorize or JIT.
+        """
         print("\n" + "="*60)
         print("📊 DIAGNOSTIC REPORT SUMMARY")
         print("="*60)
 
-        events = [e for e in self.log_entries if e.entry_type == "EVENT"]
-        hooks = [e for e in self.log_entries if e.entry_type == "HOOK"]
-        api_calls = [e for e in self.log_entries if e.entry_type == "API_CALL"]
-        rules = [e for e in self.log_entries if e.entry_type == "RISK_RULE"]
-
-        print(f"📈 Events Fired: {len(events)}")
-        print(f"🪝 Hooks Triggered: {len(hooks)}")
-        print(f"🔌 API Calls Made: {len(api_calls)}")
-        print(f"🛡️ Risk Rules Evaluated: {len(rules)}")
+        counts = self.type_counts
+        print(f"📈 Events Fired: {counts['EVENT']}")
+        print(f"🪝 Hooks Triggered: {counts['HOOK']}")
+        print(f"🔌 API Calls Made: {counts['API_CALL']}")
+        print(f"🛡️ Risk Rules Evaluated: {counts['RISK_RULE']}")
         print()
 
-        if events:
+        if counts["EVENT"]:
             print("🎯 Event Breakdown:")
-            event_types = {}
-            for e in events:
-                event_types[e.name.split()[0]] = event_types.get(e.name.split()[0], 0) + 1
-            for event_type, count in event_types.items():
+            for event_type, count in self.event_name_counts.most_common():
                 print(f"   {event_type}: {count} times")
 
-        if hooks:
+        if counts["HOOK"]:
             print("\n🪝 Hook Breakdown:")
-            hook_types = {}
-            for h in hooks:
-                hook_types[h.name] = hook_types.get(h.name, 0) + 1
-            for hook_name, count in hook_types.items():
+            for hook_name, count in self.hook_name_counts.most_common():
                 print(f"   {hook_name}: {count} times")
 
-        if api_calls:
+        if counts["API_CALL"]:
             print("\n🔌 API Call Breakdown:")
-            api_methods = {}
-            for a in api_calls:
-                api_methods[a.name] = api_methods.get(a.name, 0) + 1
-            for method, count in api_methods.items():
+            for method, count in self.api_name_counts.most_common():
                 print(f"   {method}: {count} times")
 
         print("\n✅ Full event-to-API trace captured!")
         print("   Use this to verify your 32 risk rules work correctly.")
 
     def get_trace(self, entry_type: str = None) -> List[DiagnosticEntry]:
-        """Get trace of specific entry type or all entries."""
+        """Get trace of specific entry type or all retained entries."""
         if entry_type:
             return [e for e in self.log_entries if e.entry_type == entry_type]
-        return self.log_entries
-
-
-class DiagnosticRiskHandler(RiskEventHandler):
-    """Enhanced risk handler with diagnostic logging."""
-
-    def __init__(self, rule_engine: RuleEngine, trading_suite: Any, diagnostic: DiagnosticLogger):
-        super().__init__(rule_engine, trading_suite)
-        self.diagnostic = diagnostic
-        self._setup_diagnostic_hooks()
-
-    def _setup_diagnostic_hooks(self):
-        """Set up diagnostic hooks for all risk events."""
-        print("🔧 Diagnostic hooks attached to risk system")
-
-    async def on_position_updated(self, event: Any) -> None:
-        """Enhanced position update handler with diagnostics."""
-        # Log the event firing (this is handled by the main listener now)
-        # Call parent handler first (does risk evaluation)
-        await super().on_position_updated(event)
-
-    async def on_order_filled(self, event: Any) -> None:
-        """Enhanced order filled handler with diagnostics."""
-        # Log the event firing
-        order_data = {
-            'order_id': getattr(event, 'order_id', 'unknown'),
-            'contract_id': getattr(event, 'contractId', getattr(event, 'contract_id', 'unknown')),
-            'side': getattr(event, 'side', 0),
-            'quantity': getattr(event, 'quantity', 0),
-            'price': getattr(event, 'price', 0),
-            'source': 'order_filled_event'
-        }
-        self.diagnostic.log_event("ORDER_FILLED", "EventType.ORDER_FILLED", order_data)
-
-        # Call parent handler
-        await super().on_order_filled(event)
-
-        # Log any API calls made during order processing
-        # This would be enhanced to wrap actual API calls
+        return list(self.log_entries)
 
 
 class DiagnosticEventListener:
@@ -211,9 +256,10 @@ class DiagnosticEventListener:
     def __init__(self, enable_risk_rules: bool = True):
         self.suite: TradingSuite | None = None
         self.rule_engine: RuleEngine | None = None
-        self.risk_handler: DiagnosticRiskHandler | None = None
+        self.risk_handler: RiskEventHandler | None = None
         self.enable_risk_rules = enable_risk_rules
         self.diagnostic = DiagnosticLogger()
+        self._stop = asyncio.Event()
 
         # Event counters
         self.event_counts = {
@@ -226,11 +272,14 @@ class DiagnosticEventListener:
         """Initialize TradingSuite with diagnostic capabilities."""
         print("🔗 Initializing TradingSuite with diagnostic monitoring...")
 
-        # Set environment variables
-        import os
-        os.environ["PROJECT_X_API_KEY"] = "OXL7OhjGVXiMkRBhKR3Y8gHr83AXgjIRd9DzsT0XG/k="
-        os.environ["PROJECT_X_USERNAME"] = "jakertrader"
-        os.environ["PROJECT_X_ACCOUNT_NAME"] = "PRACTICESEP2415506106"
+        # Credentials come from the environment (see test.sh); never write
+        # them into os.environ here - putenv takes a global lock and secrets
+        # don't belong in source.
+        missing = [k for k in _REQUIRED_ENV if not os.environ.get(k)]
+        if missing:
+            raise RuntimeError(
+                f"Missing required environment variables: {', '.join(missing)}"
+            )
 
         # Create suite
         self.suite = await TradingSuite.create(
@@ -256,11 +305,11 @@ class DiagnosticEventListener:
             self.rule_engine = RuleEngine("config/risk_config.json")
             await self.rule_engine.initialize()
 
-            # Create diagnostic risk handler
-            self.risk_handler = DiagnosticRiskHandler(
+            # Plain risk handler - diagnostic logging happens in the
+            # listener's dispatch chain, not in a subclass override
+            self.risk_handler = RiskEventHandler(
                 rule_engine=self.rule_engine,
-                trading_suite=self.suite,
-                diagnostic=self.diagnostic
+                trading_suite=self.suite
             )
 
         except Exception as e:
@@ -272,15 +321,34 @@ class DiagnosticEventListener:
         if not self.suite:
             return
 
-        # Register core event handlers
-        await self.suite.on(EventType.ORDER_FILLED, self._on_order_filled)
-        await self.suite.on(EventType.POSITION_UPDATED, self._on_position_updated)
-        await self.suite.on(EventType.POSITION_PNL_UPDATE, self._on_position_pnl_update)
-
-        # Register risk rule handlers
+        # Flat jump table: one handler chain per event type, iterated by a
+        # single dispatch closure - no subclass/super() hops per event.
+        handlers: dict[Any, tuple[Any, ...]] = {
+            EventType.ORDER_FILLED: (self._on_order_filled,),
+            EventType.POSITION_UPDATED: (self._on_position_updated,),
+            EventType.POSITION_PNL_UPDATE: (self._on_position_pnl_update,),
+        }
         if self.enable_risk_rules and self.risk_handler:
-            await self.suite.on(EventType.POSITION_UPDATED, self.risk_handler.on_position_updated)
-            await self.suite.on(EventType.ORDER_FILLED, self._on_order_filled_with_risk_check)
+            handlers[EventType.ORDER_FILLED] += (self._on_order_filled_with_risk_check,)
+            handlers[EventType.POSITION_UPDATED] += (self.risk_handler.on_position_updated,)
+        self._handlers = handlers
+
+        # Submit all registrations concurrently: wall time is the slowest
+        # single registration instead of the sum of all of them.
+        await asyncio.gather(
+            *(
+                self.suite.on(event_type, self._make_dispatch(chain))
+                for event_type, chain in handlers.items()
+            )
+        )
+
+    @staticmethod
+    def _make_dispatch(chain: tuple[Any, ...]):
+        """Bind a handler chain into a single dispatch coroutine."""
+        async def _dispatch(event: Any) -> None:
+            for handler in chain:
+                await handler(event)
+        return _dispatch
 
     async def _on_order_filled(self, event: Any):
         """Handle order filled events."""
@@ -295,31 +363,58 @@ class DiagnosticEventListener:
         self.diagnostic.log_hook('on_trade_executed', trade_data)
 
     async def _on_order_filled_with_risk_check(self, event: Any):
-        """Handle order filled with risk checking."""
-        await self._on_order_filled(event)
+        """Run the risk check leg of the ORDER_FILLED chain."""
+        if not (self.enable_risk_rules and self.risk_handler):
+            return
 
-        if self.enable_risk_rules and self.risk_handler:
+        # Log the event firing - only pay for attribute probing when the
+        # diagnostic sink will actually record it
+        if self.diagnostic.enabled:
             try:
-                current_position = await self._get_current_position_info()
-                enriched_event = {
-                    'order_event': getattr(event, 'data', event),
-                    'current_position': current_position,
-                    'event_type': 'order_filled'
-                }
-                await self.risk_handler.on_order_filled(enriched_event)
-            except Exception as e:
-                print(f"Risk check failed: {e}")
+                order_id, contract_id, side, quantity, price = _ORDER_ATTRS(event)
+            except AttributeError:
+                order_id = getattr(event, 'order_id', 'unknown')
+                contract_id = getattr(event, 'contractId', getattr(event, 'contract_id', 'unknown'))
+                side = getattr(event, 'side', 0)
+                quantity = getattr(event, 'quantity', 0)
+                price = getattr(event, 'price', 0)
+            self.diagnostic.log_event("ORDER_FILLED", "EventType.ORDER_FILLED", {
+                'order_id': order_id,
+                'contract_id': contract_id,
+                'side': side,
+                'quantity': quantity,
+                'price': price,
+                'source': 'order_filled_event'
+            })
+
+        try:
+            current_position = await self._get_current_position_info()
+            enriched_event = {
+                'order_event': getattr(event, 'data', event),
+                'current_position': current_position,
+                'event_type': 'order_filled'
+            }
+            await self.risk_handler.on_order_filled(enriched_event)
+        except Exception as e:
+            print(f"Risk check failed: {e}")
 
     async def _on_position_updated(self, event: Any):
         """Handle position updated events."""
         self.event_counts["position_updated"] += 1
 
         # Log the POSITION_UPDATED event
+        try:
+            contract_id, size, pos_type, average_price = _POS_ATTRS(event)
+        except AttributeError:
+            contract_id = getattr(event, 'contractId', getattr(event, 'contract_id', 'unknown'))
+            size = getattr(event, 'size', 0)
+            pos_type = getattr(event, 'type', 0)
+            average_price = getattr(event, 'averagePrice', 0)
         position_data = {
-            'contract_id': getattr(event, 'contractId', getattr(event, 'contract_id', 'unknown')),
-            'size': getattr(event, 'size', 0),
-            'type': getattr(event, 'type', 0),
-            'average_price': getattr(event, 'averagePrice', 0),
+            'contract_id': contract_id,
+            'size': size,
+            'type': pos_type,
+            'average_price': average_price,
             'source': 'position_update_event'
         }
         self.diagnostic.log_event("POSITION_UPDATED", "EventType.POSITION_UPDATED", position_data)
@@ -328,6 +423,14 @@ class DiagnosticEventListener:
         """Handle P&L update events."""
         self.event_counts["position_pnl_update"] += 1
 
+    async def _counter_loop(self) -> None:
+        """Print the captured-event counter every 10s until stopped."""
+        while not self._stop.is_set():
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=10)
+            except asyncio.TimeoutError:
+                print(f"📊 Events captured so far: {sum(self.event_counts.values())}")
+
     async def _get_current_position_info(self):
         """Get current position info."""
         if not self.suite:
@@ -349,6 +452,7 @@ class DiagnosticEventListener:
         print("• 🔌 Which API calls are made (close_position, place_order, etc.)")
         print("="*60)
 
+        counter_task = None
         try:
             # Setup with diagnostics
             await self.setup_suite()
@@ -357,21 +461,32 @@ class DiagnosticEventListener:
             print("Press Ctrl+C to stop and generate diagnostic report.")
             print()
 
-            # Keep running to capture events
-            while True:
-                await asyncio.sleep(10)
-                print(f"📊 Events captured so far: {sum(self.event_counts.values())}")
+            # Park on a stop event instead of a polling loop; the periodic
+            # counter runs as its own cancellable task.
+            counter_task = asyncio.create_task(self._counter_loop())
+            try:
+                asyncio.get_running_loop().add_signal_handler(
+                    signal.SIGINT, self._stop.set
+                )
+            except (NotImplementedError, RuntimeError):
+                pass  # e.g. Windows event loop - fall back to KeyboardInterrupt
+            await self._stop.wait()
+            print("\n🛑 Diagnostic session stopped by user")
 
         except (KeyboardInterrupt, asyncio.CancelledError):
             print("\n🛑 Diagnostic session stopped by user")
         except Exception as e:
             print(f"\n❌ Diagnostic session failed: {e}")
         finally:
+            self._stop.set()
+            if counter_task:
+                counter_task.cancel()
             if self.suite:
                 await self.suite.disconnect()
 
             # Generate comprehensive diagnostic report
             self.diagnostic.generate_report()
+            close()
 
 
 async def main():
@@ -9,9 +9,16 @@ Usage: python event_listener.py
 """
 
 import asyncio
+import atexit
 import logging
+import operator
 import os
-from datetime import datetime
+import queue
+import re
+import signal
+import time
+from logging.handlers import QueueHandler, QueueListener
+from types import SimpleNamespace
 from typing import Any
 
 from project_x_py import TradingSuite, EventType
@@ -25,24 +32,60 @@ logging.basicConfig(
     datefmt="%H:%M:%S"
 )
 
+# Move formatting + stream writes off the event loop: handlers on the root
+# logger are replaced with a QueueHandler whose records are drained by a
+# background QueueListener thread, so the coroutine hot path only enqueues.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = QueueListener(
+    _log_queue, *logging.getLogger().handlers, respect_handler_level=True
+)
+logging.getLogger().handlers = [QueueHandler(_log_queue)]
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Skip per-record thread/process lookups nobody reads
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Mute SDK internals at the source so their records never reach the filter
+# (cheaper than formatting and then dropping them).
+logging.getLogger("project_x_py").setLevel(logging.WARNING)
+
+# One-slot timestamp cache: the HH:MM:SS prefix is re-rendered only when
+# the second rolls over, so hot handlers skip datetime construction and
+# six-field strftime on every event
+_ts_cache = [0, ""]
+
+
+def _ts() -> str:
+    """Wall-clock HH:MM:SS.mmm with a cached per-second prefix."""
+    t = time.time()
+    s = int(t)
+    if s != _ts_cache[0]:
+        _ts_cache[:] = [s, time.strftime("%H:%M:%S", time.localtime(s))]
+    return f"{_ts_cache[1]}.{int((t - s) * 1000):03d}"
+
+
+# One compiled scan for connection-status markers and our custom emojis
+_IMPORTANT_MESSAGE = re.compile(
+    "[🔗🛡🎧📈📉📊⚖🚨👻📜✅❌]|WebSocket/SignalR|CONNECTED"
+)
+
+
 # Custom log filter to show only our important logs
 class CleanLogFilter(logging.Filter):
     def filter(self, record):
-        # Allow our event listener logs
-        if record.name == '__main__':
-            return True
-        # Allow risk rule logs
-        if record.name.startswith('rules'):
+        # Tier 1: decide from the logger name alone - no message formatting
+        name = record.name
+        if name == '__main__' or name.startswith('rules'):
             return True
-        # Allow critical connection status logs
-        if 'WebSocket/SignalR' in str(record.getMessage()) or 'CONNECTED' in str(record.getMessage()):
-            return True
-        # Allow our custom emojis (trade executions, position updates, risk alerts)
-        message = str(record.getMessage())
-        if any(emoji in message for emoji in ['🔗', '🛡️', '🎧', '📈', '📉', '📊', '⚖️', '🚨', '👻', '📜', '✅', '❌']):
-            return True
-        # Block ALL other logs (SDK internal noise, HTTP requests, etc.)
-        return False
+        # Tier 2: below-WARNING records from other loggers are SDK/HTTP
+        # noise; drop them without ever rendering the message
+        if record.levelno < logging.WARNING:
+            return False
+        # Tier 3: rare fallback - format once and run a single regex scan
+        return _IMPORTANT_MESSAGE.search(record.getMessage()) is not None
 
 # Apply filter to root logger
 root_logger = logging.getLogger()
@@ -50,36 +93,112 @@ root_logger.addFilter(CleanLogFilter())
 
 logger = logging.getLogger(__name__)
 
+# Credentials come from the environment (TradingSuite.create reads them);
+# nothing is written back, so setup is side-effect free and re-entrant
+_REQUIRED_ENV = ("PROJECT_X_API_KEY", "PROJECT_X_USERNAME", "PROJECT_X_ACCOUNT_NAME")
+
+# Batch field extractors: one C call pulls every field from a dict
+# payload instead of one .get() per field
+_ORDER_DATA_FIELDS = operator.itemgetter("side", "type")
+_POS_FIELDS = operator.itemgetter("contractId", "size", "averagePrice", "type")
+_PNL_FIELDS = operator.itemgetter("contractId", "unrealizedPnl", "realizedPnl")
+
+# Decode tables built once at import: plain dict.get instead of the
+# EnumMeta.__call__ + ValueError dance on every event
+_ORDER_TYPE_NAMES = {m.value: m.name.replace("_", " ").title() for m in OrderType}
+_ORDER_STATUS_NAMES = {m.value: m.name.replace("_", " ").title() for m in OrderStatus}
+_POSITION_TYPE_NAMES = {m.value: m.name for m in PositionType}
+
+
+# Trade actions that realize P&L
+_PNL_ACTIONS = frozenset({"Reduce", "Close", "Flip"})
+
+# Maps _classify_trade_action results to their counter attributes
+_ACTION_ATTRS = {
+    "Open": "_act_open",
+    "Add": "_act_add",
+    "Reduce": "_act_reduce",
+    "Close": "_act_close",
+    "Flip": "_act_flip",
+    "Adjust": "_act_adjust",
+    "Unknown": "_act_unknown",
+}
+
 
 class EventListener:
     """Real-time event listener for diagnostic purposes with risk rules."""
 
+    # Counters are a fixed closed set, so plain slotted int attributes beat
+    # dict entries: no hash lookup per increment and no instance __dict__
+    __slots__ = (
+        "suite",
+        "rule_engine",
+        "risk_handler",
+        "enable_risk_rules",
+        "_loop",
+        "_position_changed",
+        "_activity",
+        "_stop_event",
+        "_summary_handle",
+        "_positions",
+        "_data",
+        "_cnt_order_filled",
+        "_cnt_position_updated",
+        "_cnt_pnl",
+        "_position_cache",
+        "_cache_timestamp",
+        "_cache_ttl",
+        "_act_open",
+        "_act_add",
+        "_act_reduce",
+        "_act_close",
+        "_act_flip",
+        "_act_adjust",
+        "_act_unknown",
+        "_last_confirmed_position",
+        "_position_flat_timestamp",
+        "_ignore_reopen_window",
+        "_stale_executions_filtered",
+    )
+
     def __init__(self, enable_risk_rules: bool = True):
         self.suite: TradingSuite | None = None
         self.rule_engine: RuleEngine | None = None
         self.risk_handler: RiskEventHandler | None = None
         self.enable_risk_rules = enable_risk_rules
-
-        self.event_counts = {
-            "order_filled": 0,
-            "position_updated": 0,
-            "position_pnl_update": 0,
-        }
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Set by _on_position_updated so the fill handler can wait for the
+        # position state to propagate instead of sleeping blindly
+        self._position_changed = asyncio.Event()
+        # Set by every handler; run_listener waits on it so summaries come
+        # promptly on activity instead of waking every 10s regardless
+        self._activity = asyncio.Event()
+        # Set by SIGINT/SIGTERM for a deterministic, graceful shutdown
+        self._stop_event = asyncio.Event()
+        # call_later handle for the 10s summary heartbeat
+        self._summary_handle: asyncio.TimerHandle | None = None
+        # Snapshots of the suite["MNQ"] manager chain, bound in setup_suite
+        self._positions: Any = None
+        self._data: Any = None
+
+        self._cnt_order_filled = 0
+        self._cnt_position_updated = 0
+        self._cnt_pnl = 0
         # Cache to reduce API calls
         self._position_cache: dict[str, Any] | None = None
         self._cache_timestamp: float = 0
-        self._cache_ttl = 0.5  # 500ms cache
+        # TTL is only a safety net; _on_position_updated refreshes the
+        # cache from event payloads, which is both fresher and cheaper
+        self._cache_ttl = 5.0
 
         # Track trade actions for better summary
-        self._trade_actions = {
-            "Open": 0,
-            "Add": 0,
-            "Reduce": 0,
-            "Close": 0,
-            "Reverse": 0,
-            "Adjust": 0,
-            "Unknown": 0
-        }
+        self._act_open = 0
+        self._act_add = 0
+        self._act_reduce = 0
+        self._act_close = 0
+        self._act_flip = 0
+        self._act_adjust = 0
+        self._act_unknown = 0
 
         # Track position state to detect manual closes and ghost re-opens
         self._last_confirmed_position = None  # Last position confirmed by poll
@@ -91,10 +210,15 @@ class EventListener:
         """Initialize TradingSuite for event listening."""
         logger.info("🔗 Initializing TradingSuite for event listening...")
 
-        # Set environment variables from user's input
-        os.environ["PROJECT_X_API_KEY"] = "OXL7OhjGVXiMkRBhKR3Y8gHr83AXgjIRd9DzsT0XG/k="
-        os.environ["PROJECT_X_USERNAME"] = "jakertrader"
-        os.environ["PROJECT_X_ACCOUNT_NAME"] = "PRACTICESEP2415506106"
+        # Cache the running loop once; get_event_loop() re-runs the policy
+        # lookup per call and is deprecated inside a running loop
+        self._loop = asyncio.get_running_loop()
+
+        missing = [k for k in _REQUIRED_ENV if not os.environ.get(k)]
+        if missing:
+            raise RuntimeError(
+                f"Missing required environment variables: {', '.join(missing)}"
+            )
 
         # Create suite with minimal features for event listening
         self.suite = await TradingSuite.create(
@@ -103,6 +227,12 @@ class EventListener:
             initial_days=1,  # Minimal data for faster startup
         )
 
+        # Bind the per-instrument managers once; every later fetch then
+        # skips the suite __getitem__ plus attribute-chain walk
+        mnq = self.suite["MNQ"]
+        self._positions = mnq.positions
+        self._data = mnq.data
+
         # Initialize risk rules if enabled
         if self.enable_risk_rules:
             await self._initialize_risk_rules()
@@ -113,11 +243,11 @@ class EventListener:
         logger.info("✅ TradingSuite initialized and event handlers registered")
         if self.enable_risk_rules and self.rule_engine:
             active_rules = len(self.rule_engine.rules)
-            logger.info(f"🛡️ Risk rules active: {active_rules} rules loaded")
+            logger.info("🛡️ Risk rules active: %s rules loaded", active_rules)
             # Log rule details
             for rule in self.rule_engine.rules:
                 rule_stats = rule.get_stats()
-                logger.info(f"   📋 Rule loaded: {rule_stats}")
+                logger.info("   📋 Rule loaded: %s", rule_stats)
         logger.info("🎧 Ready to receive real-time events from broker...")
 
     async def _register_event_handlers(self):
@@ -151,7 +281,7 @@ class EventListener:
                         # Register for both event names that PositionManager uses
                         await instrument_ctx.positions.event_bus.on(EventType.POSITION_UPDATED, self.risk_handler.on_position_updated)
                         await instrument_ctx.positions.event_bus.on(EventType.POSITION_CLOSED, self.risk_handler.on_position_updated)
-                        logger.info(f"📡 Direct registration with {instrument_ctx.symbol} PositionManager")
+                        logger.info("📡 Direct registration with %s PositionManager", instrument_ctx.symbol)
             elif hasattr(self.suite, '_positions'):
                 # Single-instrument mode - register for PositionManager's callback system
                 # This is the primary way PositionManager communicates events
@@ -179,38 +309,60 @@ class EventListener:
             )
 
         except Exception as e:
-            logger.error(f"Failed to initialize risk rules: {e}")
+            logger.error("Failed to initialize risk rules: %s", e)
             self.enable_risk_rules = False
 
     async def _on_order_filled(self, event: Any) -> None:
         """Handle order filled events with unified trade execution logging."""
         try:
-            self.event_counts["order_filled"] += 1
+            self._cnt_order_filled += 1
+            self._activity.set()
             data = event.data
+            info_enabled = logger.isEnabledFor(logging.INFO)
 
-            order_id = self._safe_get(data, "order_id", "unknown")
-            order_data = self._safe_get(data, "order_data", {})
+            # Specialize field access once per event instead of paying
+            # _safe_get's isinstance + method-call overhead per field
+            get = data.get if isinstance(data, dict) else lambda k, d=None, _o=data: getattr(_o, k, d)
+            order_id = get("order_id", "unknown")
+            order_data = get("order_data", {})
 
-            # Decode order details
-            side_int = self._safe_get(order_data, "side", 0)
+            # Decode order details - batch extract on the dict fast path
+            if isinstance(order_data, dict):
+                try:
+                    side_int, type_int = _ORDER_DATA_FIELDS(order_data)
+                except KeyError:
+                    side_int = order_data.get("side", 0)
+                    type_int = order_data.get("type", 2)
+            else:
+                side_int = getattr(order_data, "side", 0)
+                type_int = getattr(order_data, "type", 2)
             side = "BUY" if side_int == OrderSide.BUY else "SELL"
-
-            type_int = self._safe_get(order_data, "type", 2)
             order_type = self._decode_order_type(type_int)
 
-            # Get position state before this fill (use cache when possible)
-            prev_position = await self._get_current_position_info(force_refresh=False)
-
-            # Wait for position update to propagate
-            await asyncio.sleep(0.1)
+            # Position state before this fill comes from the confirmed state
+            # _on_position_updated already maintains - no extra fetch needed
+            prev_position = (
+                self._last_confirmed_position
+                if self._last_confirmed_position and self._last_confirmed_position.get('size')
+                else None
+            )
 
-            # Get position after fill (don't force refresh to reduce API calls)
-            current_position = await self._get_current_position_info(force_refresh=False)
+            # Wait for the position update to propagate instead of a blind
+            # 100ms sleep that stalls every subsequent frame for this handler
+            try:
+                await asyncio.wait_for(self._position_changed.wait(), timeout=0.2)
+                self._position_changed.clear()
+            except TimeoutError:
+                pass
 
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+            # Single position fetch after the fill (cache-friendly); only
+            # price the position when the trade report will actually log it
+            current_position = await self._get_current_position_info(
+                force_refresh=False, with_pnl=info_enabled
+            )
 
             # Check if this is a stale execution after manual close
-            now = asyncio.get_event_loop().time()
+            now = self._loop.time()
             is_stale_after_manual_close = (
                 self._position_flat_timestamp and
                 (now - self._position_flat_timestamp) < self._ignore_reopen_window and
@@ -220,54 +372,67 @@ class EventListener:
             if is_stale_after_manual_close:
                 elapsed = now - self._position_flat_timestamp
                 self._stale_executions_filtered += 1
-                logger.warning(f"📜 STALE_EXECUTION_IGNORED | Order {order_id} | {elapsed:.1f}s after manual close")
-                logger.warning(f"   This order fill is likely from before manual close - ignoring for position tracking")
-                logger.warning(f"   Confirmed position remains: {self._last_confirmed_position or 'FLAT'}")
+                logger.warning(
+                    "📜 STALE_EXECUTION_IGNORED | Order %s | %.1fs after manual close\n"
+                    "   This order fill is likely from before manual close - ignoring for position tracking\n"
+                    "   Confirmed position remains: %s",
+                    order_id, elapsed, self._last_confirmed_position or "FLAT",
+                )
                 return
 
             # Determine trade action type
             trade_action = self._classify_trade_action(prev_position, current_position, side)
-            self._trade_actions[trade_action] += 1
+            attr = _ACTION_ATTRS.get(trade_action, "_act_unknown")
+            setattr(self, attr, getattr(self, attr) + 1)
+
+            # Everything below is formatting; skip it all when INFO is off
+            if not info_enabled:
+                return
 
-            logger.info(f"\n📈 TRADE_EXECUTED | {timestamp}")
-            logger.info(f"   ID: {order_id}")
-            logger.info(f"   Action: {side} ({order_type}) - {trade_action}")
+            # Build the whole trade report and emit it as ONE record: one
+            # filter pass, one queue put, one stream write instead of eight
+            timestamp = _ts()
+            lines = [
+                f"\n📈 TRADE_EXECUTED | {timestamp}",
+                f"   ID: {order_id}",
+                f"   Action: {side} ({order_type}) - {trade_action}",
+            ]
 
             # Show position transition with proper context
             if prev_position and current_position:
                 prev_desc = f"{prev_position['direction']} {abs(prev_position['size'])}"
                 current_desc = f"{current_position['direction']} {abs(current_position['size'])}"
 
-                # Show position transition with proper context
-                logger.info(f"   Position: {prev_desc} → {current_desc}")
-                logger.info(f"   Avg Price: {current_position['avg_price']}")
+                lines.append(f"   Position: {prev_desc} → {current_desc}")
+                lines.append(f"   Avg Price: {current_position['avg_price']}")
 
                 # For now, show unrealized P&L for remaining position
                 if current_position.get('pnl') and abs(current_position['size']) > 0:
-                    logger.info(f"   Unrealized PnL: {current_position['pnl']}")
+                    lines.append(f"   Unrealized PnL: {current_position['pnl']}")
 
                 # Note: Realized PnL will be shown in session summary from position manager stats
 
             elif current_position:
                 # Opening new position
-                logger.info(f"   Position Opened: {current_position['direction']} {abs(current_position['size'])}")
-                logger.info(f"   Avg Price: {current_position['avg_price']}")
+                lines.append(f"   Position Opened: {current_position['direction']} {abs(current_position['size'])}")
+                lines.append(f"   Avg Price: {current_position['avg_price']}")
             else:
                 # Position fully closed
                 if prev_position:
-                    logger.info(f"   Position Closed: {prev_position['direction']} {abs(prev_position['size'])} → FLAT")
+                    lines.append(f"   Position Closed: {prev_position['direction']} {abs(prev_position['size'])} → FLAT")
                     # Get final realized PnL for complete closure
                     realized_pnl = await self._get_incremental_realized_pnl(prev_position, None)
                     if realized_pnl is not None:
-                        logger.info(f"   Realized PnL: ${realized_pnl:+.2f}")
+                        lines.append(f"   Realized PnL: ${realized_pnl:+.2f}")
                 else:
-                    logger.info(f"   Position: FLAT")
+                    lines.append("   Position: FLAT")
 
-            logger.info(f"   Total Trades: {self.event_counts['order_filled']}")
+            lines.append(f"   Total Trades: {self._cnt_order_filled}")
+            logger.info("\n".join(lines))
 
         except Exception as e:
-            logger.error(f"Error in event handler _on_order_filled: {e}")
-            logger.error(f"Event data: {event.data}")
+            logger.error("Error in event handler _on_order_filled: %s", e)
+            logger.error("Event data: %s", event.data)
 
     async def _on_order_filled_with_risk_check(self, event: Any) -> None:
         """Handle order filled events with immediate risk checking."""
@@ -291,40 +456,56 @@ class EventListener:
                 await self.risk_handler.on_order_filled(enriched_event)
 
             except Exception as e:
-                logger.error(f"Error in risk check after order fill: {e}")
+                logger.error("Error in risk check after order fill: %s", e)
 
     async def _on_position_updated(self, event: Any) -> None:
         """Handle position updated events - detect manual closes and filter ghost re-opens."""
         try:
-            self.event_counts["position_updated"] += 1
+            self._cnt_position_updated += 1
+            self._activity.set()
             position = event.data
 
-            # Handle both object and dict formats
-            contract = self._safe_get(position, 'contractId', 'unknown')
-            size = self._safe_get(position, 'size', 0)
-            avg_price = self._safe_get(position, 'averagePrice', 0)
-            pos_type = self._safe_get(position, 'type', 0)
+            # Handle both object and dict formats; the dict fast path pulls
+            # all four fields in one C call
+            if isinstance(position, dict):
+                try:
+                    contract, size, avg_price, pos_type = _POS_FIELDS(position)
+                except KeyError:
+                    get = position.get
+                    contract = get('contractId', 'unknown')
+                    size = get('size', 0)
+                    avg_price = get('averagePrice', 0)
+                    pos_type = get('type', 0)
+            else:
+                contract = getattr(position, 'contractId', 'unknown')
+                size = getattr(position, 'size', 0)
+                avg_price = getattr(position, 'averagePrice', 0)
+                pos_type = getattr(position, 'type', 0)
 
             direction = self._decode_position_type(pos_type)
-            now = asyncio.get_event_loop().time()
+            now = self._loop.time()
+            is_in_ignore_window = bool(
+                self._position_flat_timestamp
+                and (now - self._position_flat_timestamp) < self._ignore_reopen_window
+            )
 
             # Detect manual position closures (size goes to 0)
             if size == 0 and self._last_confirmed_position and abs(self._last_confirmed_position.get('size', 0)) > 0:
                 self._position_flat_timestamp = now
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                logger.info(f"\n📉 MANUAL_POSITION_CLOSED | {timestamp}")
-                logger.info(f"   Contract: {contract}")
-                logger.info(f"   Final Size: {size} (confirmed flat)")
-                logger.info(f"   Previous Position: {self._last_confirmed_position.get('direction')} {abs(self._last_confirmed_position.get('size', 0))}")
-                logger.info(f"   Ignoring reopen events for {self._ignore_reopen_window}s")
+                if logger.isEnabledFor(logging.INFO):
+                    timestamp = _ts()
+                    logger.info(
+                        f"\n📉 MANUAL_POSITION_CLOSED | {timestamp}\n"
+                        f"   Contract: {contract}\n"
+                        f"   Final Size: {size} (confirmed flat)\n"
+                        f"   Previous Position: {self._last_confirmed_position.get('direction')} {abs(self._last_confirmed_position.get('size', 0))}\n"
+                        f"   Ignoring reopen events for {self._ignore_reopen_window}s"
+                    )
 
             # Check if this is a potential "ghost reopen" after a manual close
-            elif (size != 0 and
-                  self._position_flat_timestamp and
-                  (now - self._position_flat_timestamp) < self._ignore_reopen_window):
-
+            elif size != 0 and is_in_ignore_window:
                 elapsed = now - self._position_flat_timestamp
-                logger.warning(f"👻 GHOST_REOPEN_DETECTED | Contract: {contract} | Size: {size} | {elapsed:.1f}s after manual close")
+                logger.warning("👻 GHOST_REOPEN_DETECTED | Contract: %s | Size: %s | %.1fs after manual close", contract, size, elapsed)
                 logger.warning("   This position change may be SDK catching up with manual order processing")
                 logger.warning("   Ignoring for position state tracking - will be resolved by next poll")
 
@@ -339,71 +520,104 @@ class EventListener:
                 'avg_price': f"${avg_price:.2f}" if avg_price else "unknown"
             }
 
+            # Refresh the position cache straight from the event payload so
+            # the next fill handler skips the get_all_positions round-trip.
+            # Keep an attribute view of the position so a cache hit that
+            # needs P&L can still run calculate_position_pnl and backfill.
+            self._position_cache = {
+                "contract": contract,
+                "size": size,
+                "avg_price": f"${avg_price:.2f}",
+                "direction": direction,
+                "pnl": None,
+                "_position": (
+                    SimpleNamespace(averagePrice=avg_price, size=size, type=pos_type)
+                    if isinstance(position, dict) else position
+                ),
+            } if size != 0 else None
+            self._cache_timestamp = now
+            self._position_changed.set()
+
             # When risk rules are active, let them handle detailed logging
             # Only log significant position changes (not ghost reopens)
-            if size != 0 and not (self._position_flat_timestamp and (now - self._position_flat_timestamp) < self._ignore_reopen_window):
-                if self.enable_risk_rules:
-                    # Risk rules will handle their own logging
+            if size != 0 and not is_in_ignore_window:
+                if self.enable_risk_rules or not logger.isEnabledFor(logging.INFO):
+                    # Risk rules handle their own logging (or INFO is off)
                     pass
                 else:
-                    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                    logger.info(f"\n📊 POSITION_UPDATED | {timestamp}")
-                    logger.info(f"   Contract: {contract}")
-                    logger.info(f"   Size: {size} ({direction})")
-                    logger.info(f"   Avg Price: ${avg_price:.2f}")
-                    logger.info(f"   Total Updates: {self.event_counts['position_updated']}")
+                    timestamp = _ts()
+                    logger.info(
+                        f"\n📊 POSITION_UPDATED | {timestamp}\n"
+                        f"   Contract: {contract}\n"
+                        f"   Size: {size} ({direction})\n"
+                        f"   Avg Price: ${avg_price:.2f}\n"
+                        f"   Total Updates: {self._cnt_position_updated}"
+                    )
 
         except Exception as e:
-            logger.error(f"Error in event handler _on_position_updated: {e}")
-            logger.error(f"Event data: {event.data}")
+            logger.error("Error in event handler _on_position_updated: %s", e)
+            logger.error("Event data: %s", event.data)
 
     async def _on_position_pnl_update(self, event: Any) -> None:
         """Handle position P&L update events - log periodically to avoid spam."""
         try:
-            self.event_counts["position_pnl_update"] += 1
+            self._cnt_pnl += 1
+            self._activity.set()
+
+            # Only log every 16th P&L update to reduce spam, and skip all
+            # extraction/formatting when the record would be dropped. The
+            # power-of-two cadence makes the drop test a single AND.
+            if self._cnt_pnl & 15 or not logger.isEnabledFor(logging.INFO):
+                return
+
             pnl_data = event.data
 
             # Extract P&L details (handle both dict and object)
-            contract = self._safe_get(pnl_data, "contractId", "unknown")
-            unrealized_pnl = self._safe_get(pnl_data, "unrealizedPnl", 0)
-            realized_pnl = self._safe_get(pnl_data, "realizedPnl", 0)
-
-            # Only log P&L updates every 10th event to reduce spam
-            if self.event_counts["position_pnl_update"] % 10 == 0:
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                logger.info(f"\n💰 P&L_UPDATE | {timestamp}")
-                logger.info(f"   Contract: {contract}")
-                logger.info(f"   Unrealized PnL: ${unrealized_pnl:+.2f}")
-                logger.info(f"   Realized PnL: ${realized_pnl:+.2f}")
-                logger.info(f"   Total Updates: {self.event_counts['position_pnl_update']}")
+            if isinstance(pnl_data, dict):
+                try:
+                    contract, unrealized_pnl, realized_pnl = _PNL_FIELDS(pnl_data)
+                except KeyError:
+                    get = pnl_data.get
+                    contract = get("contractId", "unknown")
+                    unrealized_pnl = get("unrealizedPnl", 0)
+                    realized_pnl = get("realizedPnl", 0)
+            else:
+                contract = getattr(pnl_data, "contractId", "unknown")
+                unrealized_pnl = getattr(pnl_data, "unrealizedPnl", 0)
+                realized_pnl = getattr(pnl_data, "realizedPnl", 0)
+
+            timestamp = _ts()
+            logger.info(
+                f"\n💰 P&L_UPDATE | {timestamp}\n"
+                f"   Contract: {contract}\n"
+                f"   Unrealized PnL: ${unrealized_pnl:+.2f}\n"
+                f"   Realized PnL: ${realized_pnl:+.2f}\n"
+                f"   Total Updates: {self._cnt_pnl}"
+            )
 
         except Exception as e:
-            logger.error(f"Error in event handler _on_position_pnl_update: {e}")
-            logger.error(f"Event data: {event.data}")
+            logger.error("Error in event handler _on_position_pnl_update: %s", e)
+            logger.error("Event data: %s", event.data)
 
     def _decode_order_type(self, type_int: int) -> str:
         """Decode order type integer to readable string."""
-        try:
-            order_type = OrderType(type_int)
-            return order_type.name.replace('_', ' ').title()
-        except ValueError:
-            return f"UNKNOWN({type_int})"
+        return _ORDER_TYPE_NAMES.get(type_int) or f"UNKNOWN({type_int})"
 
     def _decode_order_status(self, status_int: int) -> str:
         """Decode order status integer to readable string."""
-        try:
-            status = OrderStatus(status_int)
-            return status.name.replace('_', ' ').title()
-        except ValueError:
-            return f"UNKNOWN({status_int})"
+        return _ORDER_STATUS_NAMES.get(status_int) or f"UNKNOWN({status_int})"
 
     def _decode_position_type(self, type_int: int) -> str:
         """Decode position type integer to readable string."""
-        try:
-            pos_type = PositionType(type_int)
-            return pos_type.name
-        except ValueError:
-            return f"UNKNOWN({type_int})"
+        return _POSITION_TYPE_NAMES.get(type_int) or f"UNKNOWN({type_int})"
+
+    def _snapshot_counts(self) -> dict[str, int]:
+        """Build the legacy event-count dict shape for summaries."""
+        return {
+            "order_filled": self._cnt_order_filled,
+            "position_updated": self._cnt_position_updated,
+            "position_pnl_update": self._cnt_pnl,
+        }
 
     def _safe_get(self, obj: Any, key: str, default: Any = None) -> Any:
         """Safely get attribute from dict or object."""
@@ -412,40 +626,38 @@ class EventListener:
         return getattr(obj, key, default)
 
     def _classify_trade_action(self, prev_pos: dict[str, Any] | None, current_pos: dict[str, Any] | None, order_side: str) -> str:
-        """Classify the type of trade action: Open, Add, Reduce, Close, Flip."""
-        if not prev_pos and current_pos:
-            # No previous position, now have one = OPEN
-            return "Open"
-        elif prev_pos and not current_pos:
-            # Had position, now flat = CLOSE
+        """Classify the type of trade action: Open, Add, Reduce, Close, Flip.
+
+        Runs on every fill, so sizes and directions are unboxed into locals
+        once and compared through a flat branch chain - no repeated dict
+        indexing or abs() dispatch on the hot path.
+        """
+        if not prev_pos:
+            return "Open" if current_pos else "Unknown"
+        if not current_pos:
+            return "Close"
+
+        ps = prev_pos['size']
+        cs = current_pos['size']
+        aps = -ps if ps < 0 else ps
+        acs = -cs if cs < 0 else cs
+
+        # Zero-size edge cases
+        if aps == 0:
+            return "Open" if acs > 0 else "Unknown"
+        if acs == 0:
             return "Close"
-        elif prev_pos and current_pos:
-            prev_size = prev_pos['size']
-            current_size = current_pos['size']
-            prev_direction = prev_pos['direction']
-            current_direction = current_pos['direction']
-
-            # Handle zero size cases
-            if abs(prev_size) == 0 and abs(current_size) > 0:
-                return "Open"
-            elif abs(current_size) == 0 and abs(prev_size) > 0:
-                return "Close"
-
-            # Same direction changes
-            if current_direction == prev_direction:
-                if abs(current_size) > abs(prev_size):
-                    return "Add"        # Scaling up
-                elif abs(current_size) < abs(prev_size):
-                    return "Reduce"     # Scaling down
-                else:
-                    return "Adjust"     # Same size, possibly price adjustment
 
-            # Direction changed - this is a reversal (close old + open new)
-            elif current_direction != prev_direction:
-                return "Flip"
+        # Direction changed - this is a reversal (close old + open new)
+        if prev_pos['direction'] != current_pos['direction']:
+            return "Flip"
 
-        # Unknown state
-        return "Unknown"
+        # Same direction: scaling up, scaling down, or a price adjustment
+        if acs > aps:
+            return "Add"
+        if acs < aps:
+            return "Reduce"
+        return "Adjust"
 
     async def _get_realized_pnl(self, contract_id: str) -> float | None:
         """Get total realized PnL from position manager stats."""
@@ -454,7 +666,7 @@ class EventListener:
 
         try:
             # Use position manager reporting to get cumulative realized PnL
-            report = await self.suite["MNQ"].positions.get_performance_report()
+            report = await self._positions.get_performance_report()
             return report.get("realized_pnl", 0.0)
         except Exception:
             return None
@@ -497,19 +709,31 @@ class EventListener:
 
         return None
 
-    async def _get_current_position_info(self, force_refresh: bool = False) -> dict[str, Any] | None:
-        """Get current position info from broker (ground truth) with caching."""
+    async def _get_current_position_info(
+        self, force_refresh: bool = False, with_pnl: bool = False
+    ) -> dict[str, Any] | None:
+        """Get current position info from broker (ground truth) with caching.
+
+        The unrealized P&L lookup costs two extra awaits (current price +
+        pnl calc), so it only runs when ``with_pnl`` is set - i.e. when a
+        caller will actually display it.
+        """
         if not self.suite:
             return None
 
         # Check cache first
-        now = asyncio.get_event_loop().time()
+        now = self._loop.time()
         if not force_refresh and self._position_cache and (now - self._cache_timestamp) < self._cache_ttl:
-            return self._position_cache
+            cached = self._position_cache
+            # Event-built entries carry pnl=None; when the caller will
+            # display it, price the cached position and backfill in place
+            if with_pnl and cached["pnl"] is None and cached.get("_position") is not None:
+                cached["pnl"] = await self._fetch_unrealized_pnl(cached["_position"])
+            return cached
 
         try:
             # Use non-deprecated accessor
-            positions = await self.suite["MNQ"].positions.get_all_positions()
+            positions = await self._positions.get_all_positions()
 
             if not positions:
                 self._position_cache = None
@@ -524,27 +748,21 @@ class EventListener:
                 self._cache_timestamp = now
                 return None
 
-            direction = self._decode_position_type(self._safe_get(position, 'type', 0))
+            get = position.get if isinstance(position, dict) else lambda k, d=None, _o=position: getattr(_o, k, d)
+            direction = self._decode_position_type(get('type', 0))
 
-            # Try to get P&L
+            # Try to get P&L (only when the caller will display it)
             pnl_info = None
-            try:
-                current_price = await self.suite["MNQ"].data.get_current_price()
-                if current_price:
-                    pnl_data = await self.suite["MNQ"].positions.calculate_position_pnl(
-                        position, float(current_price)
-                    )
-                    unrealized_pnl = pnl_data.get("unrealized_pnl", 0)
-                    pnl_info = f"${unrealized_pnl:+.2f}"
-            except Exception:
-                pass
+            if with_pnl:
+                pnl_info = await self._fetch_unrealized_pnl(position)
 
             result = {
-                "contract": self._safe_get(position, 'contractId', 'unknown'),
-                "size": self._safe_get(position, 'size', 0),
-                "avg_price": f"${self._safe_get(position, 'averagePrice', 0):.2f}",
+                "contract": get('contractId', 'unknown'),
+                "size": get('size', 0),
+                "avg_price": f"${get('averagePrice', 0):.2f}",
                 "direction": direction,
-                "pnl": pnl_info
+                "pnl": pnl_info,
+                "_position": position,
             }
 
             # Cache result
@@ -554,7 +772,20 @@ class EventListener:
             return result
 
         except Exception as e:
-            logger.warning(f"Could not fetch position info: {e}")
+            logger.warning("Could not fetch position info: %s", e)
+            return None
+
+    async def _fetch_unrealized_pnl(self, position: Any) -> str | None:
+        """Price the given position and format its unrealized P&L."""
+        try:
+            current_price = await self._data.get_current_price()
+            if not current_price:
+                return None
+            pnl_data = await self._positions.calculate_position_pnl(
+                position, float(current_price)
+            )
+            return f"${pnl_data.get('unrealized_pnl', 0):+.2f}"
+        except Exception:
             return None
 
     async def log_connection_status(self):
@@ -572,68 +803,88 @@ class EventListener:
             rules_active = len(stats['rules'])
 
             if events_processed > 0:
-                logger.info(f"🛡️ Risk monitoring active: {rules_active} rules processed {events_processed} events")
+                logger.info("🛡️ Risk monitoring active: %s rules processed %s events", rules_active, events_processed)
             else:
-                logger.info(f"🛡️ Risk monitoring active: {rules_active} rules ready (waiting for events)")
+                logger.info("🛡️ Risk monitoring active: %s rules ready (waiting for events)", rules_active)
         elif self.enable_risk_rules:
             logger.warning("🛡️ Risk rules enabled but not initialized")
         # If risk rules disabled, don't log anything
 
     async def log_event_summary(self):
         """Log summary of events received."""
-        total_events = sum(self.event_counts.values())
+        total_events = self._cnt_order_filled + self._cnt_position_updated + self._cnt_pnl
         if total_events > 0:
-            logger.info(f"\n📊 SESSION SUMMARY | Total Events: {total_events}")
-
-            # Show trade action breakdown (filter out zero counts)
-            actions_summary = []
-            meaningful_actions = []
-            for action, count in self._trade_actions.items():
-                if count > 0:
-                    actions_summary.append(f"{action}:{count}")
-                    meaningful_actions.append(action)
-
-            if actions_summary:
-                logger.info(f"   Trade Types: {', '.join(actions_summary)}")
+            # Single pre-joined record for the whole summary block
+            lines = [f"\n📊 SESSION SUMMARY | Total Events: {total_events}"]
+
+            # Trade action breakdown: one pass over the counters feeds both
+            # the display strings and the P&L-realizing subset
+            items = [
+                (action, count)
+                for action, attr in _ACTION_ATTRS.items()
+                if (count := getattr(self, attr))
+            ]
+            if items:
+                lines.append(f"   Trade Types: {', '.join(f'{n}:{c}' for n, c in items)}")
 
                 # Show which actions realize PnL
-                pnl_actions = [action for action in meaningful_actions if action in ["Reduce", "Close", "Flip"]]
+                pnl_actions = [n for n, _ in items if n in _PNL_ACTIONS]
                 if pnl_actions:
-                    logger.info(f"   PnL Realizing Actions: {', '.join(pnl_actions)}")
+                    lines.append(f"   PnL Realizing Actions: {', '.join(pnl_actions)}")
 
-            logger.info(f"   Position Changes: {self.event_counts['position_updated']}")
-            logger.info(f"   P&L Updates: {self.event_counts['position_pnl_update']}")
+            lines.append(f"   Position Changes: {self._cnt_position_updated}")
+            lines.append(f"   P&L Updates: {self._cnt_pnl}")
             if self._stale_executions_filtered > 0:
-                logger.info(f"   Stale Executions Filtered: {self._stale_executions_filtered}")
+                lines.append(f"   Stale Executions Filtered: {self._stale_executions_filtered}")
 
             # Show confirmed position state (filtered for ghost reopens)
             if self._last_confirmed_position and self._last_confirmed_position.get('size', 0) != 0:
                 pos = self._last_confirmed_position
-                logger.info(f"   Confirmed Position: {pos['direction']} {pos['size']} @ {pos['avg_price']}")
+                lines.append(f"   Confirmed Position: {pos['direction']} {pos['size']} @ {pos['avg_price']}")
             else:
-                logger.info(f"   Confirmed Position: FLAT")
+                lines.append("   Confirmed Position: FLAT")
 
                 # If we have a recent manual close, mention it
                 if self._position_flat_timestamp:
-                    elapsed = asyncio.get_event_loop().time() - self._position_flat_timestamp
+                    elapsed = self._loop.time() - self._position_flat_timestamp
                     if elapsed < 10:  # Only show recent closes
-                        logger.info(f"   (Manually closed {elapsed:.1f}s ago)")
+                        lines.append(f"   (Manually closed {elapsed:.1f}s ago)")
 
             # Show total realized PnL
             total_realized = await self._get_realized_pnl("any")
             if total_realized is not None:
-                logger.info(f"   Total Realized PnL: ${total_realized:+.2f}")
+                lines.append(f"   Total Realized PnL: ${total_realized:+.2f}")
+
+            logger.info("\n".join(lines))
 
             # Show risk rule stats if enabled
             if self.enable_risk_rules and self.rule_engine:
                 rule_stats = self.rule_engine.get_stats()
                 breaches = rule_stats['engine_stats']['breaches_detected']
                 if breaches > 0:
-                    logger.warning(f"   Risk Breaches: {breaches} rules triggered")
+                    logger.warning("   Risk Breaches: %s rules triggered", breaches)
 
         else:
             logger.info("📊 SESSION SUMMARY | No events received yet")
 
+    async def _emit_summaries(self) -> None:
+        """Emit the periodic status/summary block."""
+        await self.log_connection_status()
+        await self.log_event_summary()
+        await self.log_risk_status()
+
+    def _schedule_summaries(self) -> None:
+        """Arm the 10s heartbeat as a plain timer callback.
+
+        call_later avoids parking a whole Task on asyncio.sleep between
+        beats - the idle cost is a single timer-heap entry.
+        """
+        self._summary_handle = self._loop.call_later(10, self._summary_cb)
+
+    def _summary_cb(self) -> None:
+        asyncio.ensure_future(self._emit_summaries())
+        self._schedule_summaries()
+
     async def run_listener(self):
         """Run the event listener loop."""
         logger.info("🎯 Starting Event Listener - Real-time Diagnostic Mode")
@@ -644,6 +895,20 @@ class EventListener:
         logger.info("   3. Press Ctrl+C to stop")
         logger.info("=" * 70)
 
+        # Graceful shutdown: a signal just sets the stop event and the
+        # loop below exits cleanly, instead of KeyboardInterrupt having to
+        # unwind through every pending awaitable
+        loop = asyncio.get_running_loop()
+        signals_registered = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._stop_event.set)
+                signals_registered.append(sig)
+            except (NotImplementedError, RuntimeError):
+                # Platforms without loop signal support fall back to the
+                # KeyboardInterrupt handling in __main__
+                break
+
         try:
             # Setup suite
             await self.setup_suite()
@@ -655,35 +920,59 @@ class EventListener:
             # Main listener loop
             logger.info("🎧 Listening for events... (Ctrl+C to stop)")
 
-            while True:
-                await asyncio.sleep(10)  # Check status every 10 seconds
-                await self.log_connection_status()
-                await self.log_event_summary()
-                await self.log_risk_status()
+            # Summaries are driven solely by the 10s call_later chain;
+            # the activity event just wakes the loop promptly so shutdown
+            # is not delayed by a parked wait
+            self._schedule_summaries()
+            stop_wait = asyncio.create_task(self._stop_event.wait())
+            try:
+                while not self._stop_event.is_set():
+                    activity_wait = asyncio.create_task(self._activity.wait())
+                    done, _ = await asyncio.wait(
+                        {activity_wait, stop_wait},
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    if stop_wait in done:
+                        activity_wait.cancel()
+                        break
+                    self._activity.clear()
+            finally:
+                stop_wait.cancel()
+            logger.info("\n🛑 Event listener stopped by user")
 
         except (KeyboardInterrupt, asyncio.CancelledError):
             logger.info("\n🛑 Event listener stopped by user")
 
         except Exception as e:
-            logger.error(f"❌ Event listener failed: {e}")
+            logger.error("❌ Event listener failed: %s", e)
             raise
 
         finally:
-            # Cleanup
+            # Cleanup: kick off the (network-bound) disconnect and print
+            # the final summary while it runs, then reap the task
+            if self._summary_handle is not None:
+                self._summary_handle.cancel()
+            for sig in signals_registered:
+                loop.remove_signal_handler(sig)
+            disconnect_task = None
             if self.suite:
-                try:
-                    logger.info(" Disconnecting...")
-                    await self.suite.disconnect()
-                except Exception as e:
-                    logger.warning(f"Error during disconnect: {e}")
+                logger.info(" Disconnecting...")
+                disconnect_task = asyncio.create_task(self.suite.disconnect())
 
             # Final summary
             logger.info("\n🏁 FINAL EVENT SUMMARY")
             logger.info("=" * 50)
-            logger.info(f"   Events Processed: {sum(self.event_counts.values())}")
-            logger.info(f"   Trade Executions: {self.event_counts['order_filled']}")
-            logger.info(f"   Position Changes: {self.event_counts['position_updated']}")
-            logger.info(f"   P&L Updates: {self.event_counts['position_pnl_update']}")
+            counts = self._snapshot_counts()
+            logger.info("   Events Processed: %s", sum(counts.values()))
+            logger.info("   Trade Executions: %s", counts["order_filled"])
+            logger.info("   Position Changes: %s", counts["position_updated"])
+            logger.info("   P&L Updates: %s", counts["position_pnl_update"])
+
+            if disconnect_task is not None:
+                try:
+                    await asyncio.wait_for(disconnect_task, timeout=5)
+                except Exception as e:
+                    logger.warning("Error during disconnect: %s", e)
             logger.info("✅ Event listener session complete")
 
 
@@ -707,7 +996,7 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("\n👋 Event listener stopped by user")
     except Exception as e:
-        logger.error(f"\n❌ Fatal error: {e}")
+        logger.error("\n❌ Fatal error: %s", e)
         import traceback
         traceback.print_exc()
         # Keep terminal open on error
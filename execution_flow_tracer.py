@@ -7,22 +7,178 @@ Event → Risk Rule Evaluation → Hook Execution → API Call → Result
 """
 
 import asyncio
+import os
+import sys
 import time
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
 import traceback
 
+# One-slot timestamp cache: the HH:MM:SS prefix re-renders only on
+# second rollover, so bursty traces skip datetime+strftime per step
+_ts_cache = [0, ""]
+
+
+def _ts() -> str:
+    t = time.time()
+    s = int(t)
+    if s != _ts_cache[0]:
+        _ts_cache[:] = [s, time.strftime("%H:%M:%S", time.localtime(s))]
+    return f"{_ts_cache[1]}.{int((t - s) * 1000):03d}"
+
+
+# Data keys echoed under each step, probed in fixed order instead of
+# filtering data.items() per step
+_INTERESTING_KEYS = (
+    'contract_id', 'size', 'result', 'breach_detected', 'method', 'final_result'
+)
+
+
+class _Step:
+    """Fixed-shape step record; slots halve the per-step allocations."""
+
+    __slots__ = ("flow_id", "timestamp", "type", "message", "data")
+
+    def __init__(self, flow_id: int, timestamp: str, type: str, message: str, data: Any):
+        self.flow_id = flow_id
+        self.timestamp = timestamp
+        self.type = type
+        self.message = message
+        self.data = data
+
 
 class ExecutionFlowTracer:
     """Traces the complete execution flow of risk management system."""
 
+    # Bounds keep RSS flat under 24/7 operation: completed flows and the
+    # per-flow step history are rings, not unbounded lists
+    MAX_COMPLETED_FLOWS = 1024
+    MAX_STEPS_PER_FLOW = 256
+
     def __init__(self):
-        self.flow_steps = []
+        # Tracing is opt-in (RISK_TRACE=1): when off, every trace_* call
+        # returns immediately and rules pay nothing for instrumentation
+        self.enabled = os.environ.get("RISK_TRACE") == "1"
+        self.flow_steps = deque(maxlen=self.MAX_COMPLETED_FLOWS)
         self.current_flow_id = 0
         self.active_flows = {}
+        # Step output is queued and drained by a background task so rule
+        # evaluation never blocks on a stdout write; the writer batches
+        # whatever has accumulated into a single write+flush
+        self._log_q: asyncio.Queue[str] = asyncio.Queue(maxsize=8192)
+        self._writer_task: asyncio.Task[None] | None = None
+        # Single worker keeps write ordering while taking the blocking
+        # stdout write (which can stall on a slow pipe/tty) off the loop
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="flow-tracer-io"
+        )
+        # Optional persistence (RISK_TRACE_FILE=path): lines accumulate in
+        # the active of two swap buffers, flushed when it passes 64KB or
+        # once a second. The full buffer is handed to a dedicated file
+        # thread while collection continues into the other buffer, so a
+        # slow disk flush never stalls trace production.
+        self._trace_path = os.environ.get("RISK_TRACE_FILE")
+        self._trace_file = None
+        self._buffers = [bytearray(), bytearray()]
+        self._active = 0
+        self._pending_flush = None
+        self._file_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="flow-tracer-file"
+        )
+        self._file_flush_threshold = 65536
+        self._file_max_delay = 1.0
+        self._last_file_flush = time.monotonic()
+        # Trigger extractors memoized per event class: the shape probe
+        # runs once per type instead of hasattr per flow start
+        self._extractor_cache: dict[type, Any] = {}
+
+    def _emit(self, text: str) -> None:
+        """Queue trace output, writing directly when no loop is running."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            sys.stdout.write(text)
+            return
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.get_running_loop().create_task(
+                self._writer_loop(), name="flow-tracer-writer"
+            )
+        try:
+            self._log_q.put_nowait(text)
+        except asyncio.QueueFull:
+            # Overrun: drop the oldest queued line rather than stall check()
+            try:
+                self._log_q.get_nowait()
+                self._log_q.task_done()
+            except asyncio.QueueEmpty:
+                pass
+            self._log_q.put_nowait(text)
+
+    def _write_blob(self, blob: str) -> None:
+        sys.stdout.write(blob)
+        sys.stdout.flush()
+        if self._trace_path:
+            self._buffer_to_file(blob.encode())
+
+    def _buffer_to_file(self, data: bytes) -> None:
+        """Fill the active buffer; swap and flush when full or stale."""
+        buf = self._buffers[self._active]
+        buf += data
+        now = time.monotonic()
+        if (len(buf) >= self._file_flush_threshold
+                or now - self._last_file_flush >= self._file_max_delay):
+            self._swap_and_flush(now)
+
+    def _swap_and_flush(self, now: float) -> None:
+        # Only stall if the previous flush is still running AND this
+        # buffer is also full - the double-buffer's worst case
+        if self._pending_flush is not None:
+            self._pending_flush.result()
+        full = self._buffers[self._active]
+        self._active ^= 1
+        self._pending_flush = self._file_executor.submit(self._flush_buffer, full)
+        self._last_file_flush = now
+
+    def _flush_buffer(self, buf: bytearray) -> None:
+        if not buf:
+            return
+        if self._trace_file is None:
+            self._trace_file = open(self._trace_path, "ab")
+        self._trace_file.write(buf)
+        self._trace_file.flush()
+        buf.clear()
+
+    def close(self) -> None:
+        """Flush any buffered trace output and release the file handle."""
+        if self._pending_flush is not None:
+            self._pending_flush.result()
+            self._pending_flush = None
+        if self._trace_path:
+            self._flush_buffer(self._buffers[self._active])
+        if self._trace_file is not None:
+            self._trace_file.close()
+            self._trace_file = None
+
+    async def _writer_loop(self) -> None:
+        q = self._log_q
+        loop = asyncio.get_running_loop()
+        while True:
+            lines = [await q.get()]
+            while not q.empty():
+                lines.append(q.get_nowait())
+            await loop.run_in_executor(self._io_executor, self._write_blob, "".join(lines))
+            for _ in lines:
+                q.task_done()
+
+    async def drain(self) -> None:
+        """Wait until every queued trace line has been written."""
+        await self._log_q.join()
 
     def start_flow(self, flow_type: str, trigger_event: Any) -> int:
         """Start a new execution flow."""
+        if not self.enabled:
+            return 0
         self.current_flow_id += 1
         flow_id = self.current_flow_id
 
@@ -31,7 +187,7 @@ class ExecutionFlowTracer:
             'type': flow_type,
             'start_time': time.time(),
             'trigger': self._extract_trigger_info(trigger_event),
-            'steps': []
+            'steps': deque(maxlen=self.MAX_STEPS_PER_FLOW)
         }
 
         self.active_flows[flow_id] = flow
@@ -45,22 +201,46 @@ class ExecutionFlowTracer:
 
     def _extract_trigger_info(self, event: Any) -> Dict[str, Any]:
         """Extract key info from trigger event."""
-        if hasattr(event, 'contractId'):
-            return {
-                'contract_id': event.contractId,
-                'size': getattr(event, 'size', 0),
-                'type': getattr(event, 'type', 'unknown')
-            }
-        elif isinstance(event, dict):
-            return {
-                'contract_id': event.get('contractId', event.get('contract_id', 'unknown')),
-                'size': event.get('size', 0),
-                'type': event.get('type', 'unknown')
-            }
-        return {'type': 'unknown_event'}
+        cls = type(event)
+        extractor = self._extractor_cache.get(cls)
+        if extractor is None:
+            extractor = self._build_extractor(cls)
+            self._extractor_cache[cls] = extractor
+        return extractor(event)
+
+    @staticmethod
+    def _build_extractor(cls: type):
+        """Probe the event class once and return a no-probe extractor."""
+        if issubclass(cls, dict):
+            def extractor(event: Any) -> Dict[str, Any]:
+                return {
+                    'contract_id': event.get('contractId', event.get('contract_id', 'unknown')),
+                    'size': event.get('size', 0),
+                    'type': event.get('type', 'unknown')
+                }
+        elif hasattr(cls, 'contractId'):
+            def extractor(event: Any) -> Dict[str, Any]:
+                return {
+                    'contract_id': event.contractId,
+                    'size': getattr(event, 'size', 0),
+                    'type': getattr(event, 'type', 'unknown')
+                }
+        else:
+            def extractor(event: Any) -> Dict[str, Any]:
+                # Instance-level contractId (not on the class) still counts
+                if hasattr(event, 'contractId'):
+                    return {
+                        'contract_id': event.contractId,
+                        'size': getattr(event, 'size', 0),
+                        'type': getattr(event, 'type', 'unknown')
+                    }
+                return {'type': 'unknown_event'}
+        return extractor
 
     def trace_risk_evaluation(self, flow_id: int, rule_name: str, event_data: Any, rule_result: bool):
         """Trace risk rule evaluation."""
+        if not self.enabled:
+            return
         self._log_step(flow_id, "RISK_EVAL", f"🛡️ {rule_name} evaluating", {
             'rule_name': rule_name,
             'event_data': event_data,
@@ -70,6 +250,8 @@ class ExecutionFlowTracer:
 
     def trace_hook_execution(self, flow_id: int, hook_name: str, hook_data: Any):
         """Trace hook execution."""
+        if not self.enabled:
+            return
         self._log_step(flow_id, "HOOK_EXEC", f"🪝 {hook_name} executing", {
             'hook_name': hook_name,
             'data': hook_data
@@ -77,6 +259,8 @@ class ExecutionFlowTracer:
 
     def trace_api_call(self, flow_id: int, method_name: str, parameters: Any, result: Any = None):
         """Trace API call execution."""
+        if not self.enabled:
+            return
         self._log_step(flow_id, "API_CALL", f"🔌 {method_name} calling", {
             'method': method_name,
             'parameters': parameters,
@@ -85,6 +269,8 @@ class ExecutionFlowTracer:
 
     def trace_flow_completion(self, flow_id: int, final_result: Any = None):
         """Complete a flow and show final result."""
+        if not self.enabled:
+            return
         if flow_id in self.active_flows:
             flow = self.active_flows[flow_id]
             duration = time.time() - flow['start_time']
@@ -101,29 +287,30 @@ class ExecutionFlowTracer:
 
     def _log_step(self, flow_id: int, step_type: str, message: str, data: Any):
         """Log a single execution step."""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-
-        step = {
-            'flow_id': flow_id,
-            'timestamp': timestamp,
-            'type': step_type,
-            'message': message,
-            'data': data
-        }
+        if not self.enabled:
+            return
+        timestamp = _ts()
+
+        step = _Step(flow_id, timestamp, step_type, message, data)
 
         # Add to active flow
         if flow_id in self.active_flows:
             self.active_flows[flow_id]['steps'].append(step)
 
-        # Print immediate output with flow tracing
+        # Build the whole step block and queue it as one string; the
+        # background writer turns a batch of steps into one syscall
         flow_prefix = f"[Flow-{flow_id}]"
-        print(f"{flow_prefix} {timestamp} | {step_type} | {message}")
+        parts = [f"{flow_prefix} {timestamp} | {step_type} | {message}\n"]
 
         # Show key data
         if isinstance(data, dict):
-            for key, value in data.items():
-                if key in ['contract_id', 'size', 'result', 'breach_detected', 'method', 'final_result']:
-                    print(f"{flow_prefix}   └─ {key}: {value}")
+            get = data.get
+            for key in _INTERESTING_KEYS:
+                value = get(key)
+                if value is not None:
+                    parts.append(f"{flow_prefix}   └─ {key}: {value}\n")
+
+        self._emit("".join(parts))
 
     def show_flow_diagram(self, flow_id: int = None):
         """Show ASCII diagram of execution flow."""
@@ -139,15 +326,15 @@ class ExecutionFlowTracer:
 
             for i, step in enumerate(flow['steps']):
                 connector = "├──" if i < len(flow['steps']) - 1 else "└──"
-                print(f"   {connector} {step['timestamp']} {step['type']}: {step['message']}")
+                print(f"   {connector} {step.timestamp} {step.type}: {step.message}")
 
                 # Show key results
-                if step['type'] == 'RISK_EVAL' and 'breach_detected' in step['data']:
-                    status = "🚨 BREACH!" if step['data']['breach_detected'] else "✅ OK"
+                if step.type == 'RISK_EVAL' and 'breach_detected' in step.data:
+                    status = "🚨 BREACH!" if step.data['breach_detected'] else "✅ OK"
                     print(f"      └─ Status: {status}")
 
-                elif step['type'] == 'API_CALL' and 'result' in step['data']:
-                    result = step['data']['result']
+                elif step.type == 'API_CALL' and 'result' in step.data:
+                    result = step.data['result']
                     status = "✅ SUCCESS" if result and result.get('success') else "❌ FAILED"
                     print(f"      └─ Result: {status}")
 
@@ -164,14 +351,23 @@ class TracedMaxContractsRule:
     def __init__(self, config):
         self.config = config
         self._breach_count = 0
+        # Bind hot config fields once (same as MaxContractsRule)
+        self._max_size = config.max_size
+        self._auto_flatten_enabled = config.auto_flatten
 
     async def check(self, position_event: Any, trading_suite: Any) -> bool:
         """Check rule with full execution tracing."""
+        # Bind the tracer methods once: the body makes ~7 tracer calls and
+        # LOAD_FAST beats LOAD_GLOBAL+LOAD_ATTR on each of them
+        tracer = execution_tracer
+        _log = tracer._log_step
+        _done = tracer.trace_flow_completion
+
         # Start execution flow
-        flow_id = execution_tracer.start_flow("RISK_RULE_EVALUATION", position_event)
+        flow_id = tracer.start_flow("RISK_RULE_EVALUATION", position_event)
 
         try:
-            execution_tracer.trace_risk_evaluation(
+            tracer.trace_risk_evaluation(
                 flow_id, "MaxContractsRule",
                 position_event, False  # Will be updated with real result
             )
@@ -179,59 +375,70 @@ class TracedMaxContractsRule:
             # Extract position data safely
             position_data = self._extract_position_data(position_event)
             if not position_data:
-                execution_tracer.trace_flow_completion(flow_id, "EXTRACTION_FAILED")
+                _done(flow_id, "EXTRACTION_FAILED")
                 return True
 
-            current_size = abs(position_data['size'])
+            current_size = position_data['size']  # extractor already abs'd
 
             # Log evaluation details
+            max_size = self._max_size
             eval_data = {
                 'current_size': current_size,
-                'max_allowed': self.config.max_size,
-                'will_breach': current_size > self.config.max_size
+                'max_allowed': max_size,
+                'will_breach': current_size > max_size
             }
-            execution_tracer._log_step(flow_id, "EVAL_DETAIL", f"📊 Size check: {current_size} > {self.config.max_size}", eval_data)
+            _log(flow_id, "EVAL_DETAIL", f"📊 Size check: {current_size} > {max_size}", eval_data)
 
-            if current_size > self.config.max_size:
+            if current_size > max_size:
                 # Breach detected - handle it
                 await self._handle_breach(position_data, trading_suite, flow_id)
-                execution_tracer.trace_flow_completion(flow_id, "BREACH_HANDLED")
+                _done(flow_id, "BREACH_HANDLED")
                 return False
 
-            execution_tracer.trace_flow_completion(flow_id, "NO_BREACH")
+            _done(flow_id, "NO_BREACH")
             return True
 
         except Exception as e:
-            execution_tracer._log_step(flow_id, "ERROR", f"❌ Rule evaluation failed: {e}", {'error': str(e)})
-            execution_tracer.trace_flow_completion(flow_id, "ERROR")
+            _log(flow_id, "ERROR", f"❌ Rule evaluation failed: {e}", {'error': str(e)})
+            _done(flow_id, "ERROR")
             return True
 
     def _extract_position_data(self, position_event: Any):
-        """Extract position data with tracing."""
-        try:
-            if isinstance(position_event, dict) and 'current_position' in position_event:
-                current_pos = position_event['current_position']
-                if current_pos:
-                    order_event = position_event.get('order_event', {})
-                    contract_id = (order_event.get('contractId') or
-                                 order_event.get('contract_id') or
-                                 (current_pos['contractId'] if hasattr(current_pos, '__getitem__') else getattr(current_pos, 'contractId', 'unknown')) or
-                                 'unknown')
-                    account_id = (order_event.get('accountId') or
-                                order_event.get('account_id') or
-                                'unknown')
-                    size = abs(current_pos['size'] if hasattr(current_pos, '__getitem__') else getattr(current_pos, 'size', 0))
-
-                    return {
-                        'contract_id': contract_id,
-                        'account_id': account_id,
-                        'size': size,
-                        'event': position_event
-                    }
+        """Extract position data with tracing.
+
+        Single isinstance dispatch on the payload shape; no hasattr probes
+        on the per-event path. Shape preconditions are checked up front,
+        so only missing-field errors are handled; a malformed size
+        propagates to check()'s fail-safe rather than being swallowed.
+        """
+        if type(position_event) is not dict:
             return None
-        except Exception as e:
-            print(f"Position extraction error: {e}")
+        cur = position_event.get('current_position')
+        if not cur:
+            return None
+        order_event = position_event.get('order_event') or {}
+        try:
+            if isinstance(cur, dict):
+                cur_contract = cur.get('contractId')
+                size = cur.get('size', 0)
+            else:
+                cur_contract = getattr(cur, 'contractId', None)
+                size = getattr(cur, 'size', 0)
+            contract_id = (order_event.get('contractId')
+                           or order_event.get('contract_id')
+                           or cur_contract
+                           or 'unknown')
+            account_id = (order_event.get('accountId')
+                          or order_event.get('account_id')
+                          or 'unknown')
+        except (KeyError, AttributeError):
             return None
+        return {
+            'contract_id': sys.intern(contract_id) if type(contract_id) is str else contract_id,
+            'account_id': sys.intern(account_id) if type(account_id) is str else account_id,
+            'size': abs(size),
+            'event': position_event
+        }
 
     async def _handle_breach(self, position_data: Dict[str, Any], trading_suite: Any, flow_id: int):
         """Handle breach with tracing."""
@@ -242,13 +449,13 @@ class TracedMaxContractsRule:
             'rule': 'max_contracts',
             'contract_id': position_data['contract_id'],
             'breach_size': position_data['size'],
-            'limit': self.config.max_size,
+            'limit': self._max_size,
             'breach_count': self._breach_count
         }
         execution_tracer.trace_hook_execution(flow_id, "on_breach_internal", breach_data)
 
         # Auto-flatten if enabled
-        if self.config.auto_flatten and trading_suite:
+        if self._auto_flatten_enabled and trading_suite:
             await self._auto_flatten(position_data, trading_suite, flow_id)
 
     async def _auto_flatten(self, position_data: Dict[str, Any], trading_suite: Any, flow_id: int):
@@ -301,6 +508,9 @@ async def demo_execution_flow():
         'order_event': {'contractId': 'CON.F.US.MNQ.Z25', 'accountId': 'DEMO123'}
     }
 
+    # The demo exists to show the trace, so force tracing on
+    execution_tracer.enabled = True
+
     print("\n🚨 Simulating position update that triggers risk rule breach...")
     print("Position size: 5 contracts (limit: 2)")
     print()
@@ -310,6 +520,9 @@ async def demo_execution_flow():
 
     print(f"\n📋 Rule check result: {result} (False = breach detected, action taken)")
 
+    # Let the background writer finish before printing the diagram
+    await execution_tracer.drain()
+
     # Show flow diagram
     execution_tracer.show_flow_diagram()
 
@@ -336,4 +549,5 @@ if __name__ == "__main__":
         print(f"\n❌ Demo error: {e}")
         traceback.print_exc()
     finally:
+        execution_tracer.close()
         input("\n✅ Demo complete. Press Enter to exit...")
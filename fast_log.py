@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Fast logger for the diagnostic scripts.
+
+Stdlib ``logging`` serializes every record on a single ``Handler`` lock and
+formats inside that lock, which becomes the bottleneck when
+``DiagnosticEventListener`` fans out ORDER_FILLED/POSITION_UPDATED handlers
+concurrently. Here the hot path only appends a ``(level, ts_ns, msg, args,
+fields)`` tuple to a bounded per-thread ``collections.deque``; a daemon
+writer thread drains each thread's buffer, formats the whole batch once, and
+emits it with a single ``sys.stdout.buffer.write`` per batch.
+
+Usage mirrors stdlib logging closely enough for the diagnostic scripts:
+
+    from fast_log import get_logger, close
+
+    logger = get_logger(__name__)
+    logger.info("📈 TRADE_EXECUTED | %s", order_id, size=5)
+    ...
+    close()  # flush remaining records (call from finally blocks)
+"""
+
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any
+
+import orjson
+
+# Mirror stdlib logging levels so callers can keep familiar constants.
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+_LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+
+# Per-thread bounded buffers. Registration of a new thread's deque takes the
+# registry lock once; the hot path is just deque.append (atomic under the GIL).
+_BUFFER_SIZE = 8192
+_registry_lock = threading.Lock()
+_buffers: dict[int, deque[tuple[int, int, str, tuple[Any, ...], dict[str, Any]]]] = {}
+_local = threading.local()
+
+_wakeup = threading.Event()
+_shutdown = threading.Event()
+_write_lock = threading.Lock()
+_writer_thread: threading.Thread | None = None
+
+
+def _get_buffer() -> deque[tuple[int, int, str, tuple[Any, ...], dict[str, Any]]]:
+    buf = getattr(_local, "buffer", None)
+    if buf is None:
+        buf = deque(maxlen=_BUFFER_SIZE)
+        _local.buffer = buf
+        with _registry_lock:
+            _buffers[threading.get_ident()] = buf
+    return buf
+
+
+# One-slot timestamp cache: records land in per-second bursts, so the
+# strftime for the HH:MM:SS prefix is only paid on second rollover. Safe
+# without a lock because only the writer thread formats records.
+_stamp_second = -1
+_stamp_prefix = ""
+
+
+def _format_record(
+    level: int, ts_ns: int, msg: str, args: tuple[Any, ...], fields: dict[str, Any]
+) -> bytes:
+    global _stamp_second, _stamp_prefix
+    ts_s, ns_rem = divmod(ts_ns, 1_000_000_000)
+    if ts_s != _stamp_second:
+        _stamp_prefix = time.strftime("%H:%M:%S", time.localtime(ts_s))
+        _stamp_second = ts_s
+    if args:
+        msg = msg % args
+    line = f"{_stamp_prefix}.{ns_rem // 1_000_000:03d} | {_LEVEL_NAMES.get(level, level)} | {msg}"
+    if fields:
+        return line.encode() + b" " + orjson.dumps(fields, default=str)
+    return line.encode()
+
+
+def _drain_once() -> None:
+    """Drain every thread's buffer and write the batch in one syscall."""
+    with _registry_lock:
+        buffers = list(_buffers.values())
+
+    batch: list[bytes] = []
+    for buf in buffers:
+        while buf:
+            try:
+                batch.append(_format_record(*buf.popleft()))
+            except IndexError:  # raced with producer on an emptying deque
+                break
+
+    if batch:
+        blob = b"\n".join(batch) + b"\n"
+        with _write_lock:
+            sys.stdout.buffer.write(blob)
+            sys.stdout.buffer.flush()
+
+
+def _writer_loop() -> None:
+    while not _shutdown.is_set():
+        _wakeup.wait(0.05)
+        _wakeup.clear()
+        _drain_once()
+    _drain_once()  # final flush on shutdown
+
+
+def _ensure_writer() -> None:
+    global _writer_thread
+    if _writer_thread is None or not _writer_thread.is_alive():
+        with _registry_lock:
+            if _writer_thread is None or not _writer_thread.is_alive():
+                _shutdown.clear()
+                thread = threading.Thread(
+                    target=_writer_loop, name="fast-log-writer", daemon=True
+                )
+                thread.start()
+                _writer_thread = thread
+
+
+class FastLogger:
+    """Logger whose hot path is a single deque append."""
+
+    def __init__(self, name: str, level: int = INFO):
+        self.name = name
+        self.level = level
+
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802 (stdlib parity)
+        return level >= self.level
+
+    def _log(self, level: int, msg: str, args: tuple[Any, ...], fields: dict[str, Any]) -> None:
+        if level < self.level:
+            return
+        _ensure_writer()
+        _get_buffer().append((level, time.time_ns(), msg, args, fields))
+        _wakeup.set()
+
+    def debug(self, msg: str, *args: Any, **fields: Any) -> None:
+        self._log(DEBUG, msg, args, fields)
+
+    def info(self, msg: str, *args: Any, **fields: Any) -> None:
+        self._log(INFO, msg, args, fields)
+
+    def warning(self, msg: str, *args: Any, **fields: Any) -> None:
+        self._log(WARNING, msg, args, fields)
+
+    def error(self, msg: str, *args: Any, **fields: Any) -> None:
+        self._log(ERROR, msg, args, fields)
+
+
+_loggers: dict[str, FastLogger] = {}
+
+
+def get_logger(name: str = "root", level: int = INFO) -> FastLogger:
+    """Get (or create) the fast logger for ``name``."""
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = _loggers.setdefault(name, FastLogger(name, level))
+    return logger
+
+
+def close() -> None:
+    """Stop the writer thread and flush any buffered records."""
+    global _writer_thread
+    if _writer_thread is not None and _writer_thread.is_alive():
+        _shutdown.set()
+        _wakeup.set()
+        _writer_thread.join(timeout=2.0)
+    _writer_thread = None
+    _drain_once()
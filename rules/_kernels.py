@@ -0,0 +1,44 @@
+"""
+Numeric kernels for batched rule checks.
+
+The per-event ``size > max_size`` comparison is a scalar loop the
+interpreter executes once per event. When events arrive in bursts the
+engine batches sizes into an int64 array and runs the comparison here
+in one call. With numba installed the loop is JIT-compiled (and cached
+on disk); otherwise NumPy's vectorized compare provides the same
+single-call semantics.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def check_batch(sizes: np.ndarray, limits: np.ndarray) -> np.ndarray:
+        """Return a bool mask of sizes exceeding their limits."""
+        out = np.empty(sizes.size, np.bool_)
+        for i in range(sizes.size):
+            out[i] = sizes[i] > limits[i]
+        return out
+
+else:
+
+    def check_batch(sizes: np.ndarray, limits: np.ndarray) -> np.ndarray:
+        """Return a bool mask of sizes exceeding their limits."""
+        return np.greater(sizes, limits)
+
+
+def warmup() -> None:
+    """Trigger JIT compilation (a no-op on the NumPy fallback).
+
+    Called once from RuleEngine.initialize() so the first real event
+    burst doesn't pay the compile cost.
+    """
+    check_batch(np.zeros(1, np.int64), np.zeros(1, np.int64))
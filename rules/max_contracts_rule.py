@@ -6,6 +6,7 @@ Can log breaches and optionally auto-flatten positions.
 """
 
 import asyncio
+import sys
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
@@ -15,6 +16,13 @@ from project_x_py.utils import ProjectXLogger
 logger = ProjectXLogger.get_logger(__name__)
 
 
+def _intern_id(value: Any) -> Any:
+    """Intern recurring id strings (contract/account) so repeated events
+    share one string object and downstream dict lookups compare by
+    pointer instead of rehashing."""
+    return sys.intern(value) if type(value) is str else value
+
+
 @dataclass
 class MaxContractsConfig:
     """Configuration for Max Contracts rule."""
@@ -41,6 +49,12 @@ class MaxContractsRule:
         """
         self.config = config
         self._breach_count = 0
+        # Bind hot config fields once; the rule runs on every position
+        # event, so per-check dataclass attribute hops add up
+        self._enabled = config.enabled
+        self._max_size = config.max_size
+        self._auto_flatten_enabled = config.auto_flatten
+        self._severity_emoji = "🚨" if config.severity == "high" else "⚠️"
 
     async def check(self, position_event: Any, trading_suite: Any) -> bool:
         """
@@ -53,11 +67,12 @@ class MaxContractsRule:
         Returns:
             bool: True if within limits, False if breach detected
         """
-        if not self.config.enabled:
+        if not self._enabled:
             logger.debug("MaxContractsRule: disabled, skipping check")
             return True
 
-        logger.debug(f"MaxContractsRule: checking position against limit of {self.config.max_size}")
+        max_size = self._max_size
+        logger.debug(f"MaxContractsRule: checking position against limit of {max_size}")
 
         try:
             # Extract position data safely
@@ -66,9 +81,9 @@ class MaxContractsRule:
                 logger.warning("Could not extract position data from event")
                 return True
 
-            # Check size limit
-            current_size = abs(position_data['size'])
-            if current_size > self.config.max_size:
+            # Check size limit (extractors already return absolute sizes)
+            current_size = position_data['size']
+            if current_size > max_size:
                 await self._handle_breach(position_data, trading_suite)
                 return False
 
@@ -78,55 +93,103 @@ class MaxContractsRule:
             logger.error(f"Error in MaxContractsRule.check: {e}")
             return True  # Fail-safe: allow trade on error
 
+    async def check_batch(self, position_events: list, trading_suite: Any) -> bool:
+        """Check a burst of position events in one pass.
+
+        Callers that coalesce events arriving within one loop tick (e.g.
+        a P&L-update burst) amortize the per-call overhead: sizes are
+        extracted once and compared against the limit in a single sweep,
+        with only the breaching events going through breach handling.
+
+        Args:
+            position_events: Position/order events collected in one tick
+            trading_suite: TradingSuite instance for position operations
+
+        Returns:
+            bool: True if every event is within limits, False otherwise
+        """
+        if not self._enabled or not position_events:
+            return True
+
+        max_size = self._max_size
+        breaches = []
+        for event in position_events:
+            try:
+                data = self._extract_position_data(event)
+            except Exception as e:
+                logger.error(f"Error extracting batched event: {e}")
+                continue
+            if data and data['size'] > max_size:
+                breaches.append(data)
+
+        for data in breaches:
+            await self._handle_breach(data, trading_suite)
+        return not breaches
+
     def _extract_position_data(self, position_event: Any) -> Optional[Dict[str, Any]]:
-        """Extract position data from event object safely."""
+        """Extract position data from event object safely.
+
+        Dispatches once on the event's type: enriched order_filled dicts,
+        plain position-update dicts, and object events each take a direct
+        path instead of re-probing with hasattr/getattr per field. The
+        shape checks are done up front, so only missing-field errors are
+        caught here; anything else (e.g. a non-numeric size) propagates
+        to the caller's fail-safe instead of being silently swallowed.
+        """
+        if type(position_event) is not dict:
+            try:
+                return self._extract_from_obj(position_event)
+            except (KeyError, AttributeError):
+                return None
         try:
-            # Handle enriched order_filled events with current_position
-            if isinstance(position_event, dict) and 'current_position' in position_event:
-                current_pos = position_event['current_position']
-                if current_pos:
-                    # Extract contract from order event or position data
-                    order_event = position_event.get('order_event', {})
-                    contract_id = (order_event.get('contractId') or
-                                 order_event.get('contract_id') or
-                                 (current_pos['contractId'] if hasattr(current_pos, '__getitem__') else getattr(current_pos, 'contractId', 'unknown')) or
-                                 'unknown')
-                    account_id = (order_event.get('accountId') or
-                                order_event.get('account_id') or
-                                'unknown')
-                    size = abs(current_pos['size'] if hasattr(current_pos, '__getitem__') else getattr(current_pos, 'size', 0))
-
-                    return {
-                        'contract_id': contract_id,
-                        'account_id': account_id,
-                        'size': size,
-                        'event': position_event
-                    }
-
-            # Handle regular position update events
-            if isinstance(position_event, dict):
-                position = position_event.get('position') or position_event.get('new_position') or position_event
-                contract_id = position_event.get('contractId') or position_event.get('contract_id', 'unknown')
-                account_id = position_event.get('accountId') or position_event.get('account_id', 'unknown')
-                size = position.get('size', 0) if isinstance(position, dict) else getattr(position, 'size', 0)
-            else:
-                # Object format
-                position = getattr(position_event, 'position', None) or getattr(position_event, 'new_position', None) or position_event
-                contract_id = getattr(position_event, 'contractId', None) or getattr(position_event, 'contract_id', 'unknown')
-                account_id = getattr(position_event, 'accountId', None) or getattr(position_event, 'account_id', 'unknown')
-                size = getattr(position, 'size', 0)
-
-            return {
-                'contract_id': contract_id,
-                'account_id': account_id,
-                'size': size,
-                'event': position_event
-            }
-
-        except Exception as e:
-            logger.error(f"Failed to extract position data: {e}")
+            if position_event.get('current_position'):
+                return self._extract_from_enriched(position_event)
+            return self._extract_from_dict(position_event)
+        except (KeyError, AttributeError):
             return None
 
+    def _extract_from_enriched(self, position_event: Dict[str, Any]) -> Dict[str, Any]:
+        """Fast path for enriched order_filled events with current_position."""
+        cur = position_event['current_position']
+        order_event = position_event.get('order_event') or {}
+        if isinstance(cur, dict):
+            cur_contract = cur.get('contractId')
+            size = cur.get('size', 0)
+        else:
+            cur_contract = getattr(cur, 'contractId', None)
+            size = getattr(cur, 'size', 0)
+        return {
+            'contract_id': _intern_id(order_event.get('contractId')
+                                      or order_event.get('contract_id')
+                                      or cur_contract
+                                      or 'unknown'),
+            'account_id': _intern_id(order_event.get('accountId')
+                                     or order_event.get('account_id')
+                                     or 'unknown'),
+            'size': abs(size),
+            'event': position_event
+        }
+
+    def _extract_from_dict(self, position_event: Dict[str, Any]) -> Dict[str, Any]:
+        """Fast path for regular position-update dicts."""
+        position = position_event.get('position') or position_event.get('new_position') or position_event
+        return {
+            'contract_id': _intern_id(position_event.get('contractId') or position_event.get('contract_id', 'unknown')),
+            'account_id': _intern_id(position_event.get('accountId') or position_event.get('account_id', 'unknown')),
+            'size': abs(position.get('size', 0) if isinstance(position, dict) else getattr(position, 'size', 0)),
+            'event': position_event
+        }
+
+    def _extract_from_obj(self, position_event: Any) -> Dict[str, Any]:
+        """Path for object-format events."""
+        position = getattr(position_event, 'position', None) or getattr(position_event, 'new_position', None) or position_event
+        return {
+            'contract_id': _intern_id(getattr(position_event, 'contractId', None) or getattr(position_event, 'contract_id', 'unknown')),
+            'account_id': _intern_id(getattr(position_event, 'accountId', None) or getattr(position_event, 'account_id', 'unknown')),
+            'size': abs(getattr(position, 'size', 0)),
+            'event': position_event
+        }
+
     async def _handle_breach(self, position_data: Dict[str, Any], trading_suite: Any) -> None:
         """Handle a max contracts breach."""
         self._breach_count += 1
@@ -135,24 +198,25 @@ class MaxContractsRule:
         self._log_breach(position_data)
 
         # Optional: auto-flatten if enabled
-        if self.config.auto_flatten:
+        if self._auto_flatten_enabled:
             await self._auto_flatten(position_data, trading_suite)
 
     def _log_breach(self, position_data: Dict[str, Any]) -> None:
         """Log a max contracts breach."""
         contract_id = position_data['contract_id']
         account_id = position_data['account_id']
-        current_size = abs(position_data['size'])
-
-        severity_emoji = "🚨" if self.config.severity == "high" else "⚠️"
+        current_size = position_data['size']
 
         logger.warning(
-            f"{severity_emoji} MAX_CONTRACTS_BREACH "
-            f"[Rule: {self.config.max_size} max] | "
-            f"Size: {current_size} > {self.config.max_size} | "
-            f"Contract: {contract_id} | "
-            f"Account: {account_id} | "
-            f"Breach #{self._breach_count}"
+            "%s MAX_CONTRACTS_BREACH [Rule: %d max] | Size: %d > %d | "
+            "Contract: %s | Account: %s | Breach #%d",
+            self._severity_emoji,
+            self._max_size,
+            current_size,
+            self._max_size,
+            contract_id,
+            account_id,
+            self._breach_count,
         )
 
     async def _auto_flatten(self, position_data: Dict[str, Any], trading_suite: Any) -> None:
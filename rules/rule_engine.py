@@ -5,18 +5,160 @@ Loads and executes risk rules based on configuration.
 Integrates with the event-driven system.
 """
 
+import asyncio
+import functools
 import json
+import logging
 import os
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+
+import numpy as np
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from project_x_py.utils import ProjectXLogger
 
+from . import _kernels
 from .max_contracts_rule import MaxContractsConfig, MaxContractsRule
 
 logger = ProjectXLogger.get_logger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class RiskConfigSnapshot:
+    """Immutable, typed view of the risk config file.
+
+    Parsed once per (path, mtime) and shared across engines, so reloads
+    and repeated initializations read plain attributes instead of
+    re-parsing JSON and chaining dict lookups.
+    """
+
+    max_contracts_enabled: bool = False
+    max_size: int = 0
+    severity: str = "high"
+    auto_flatten: bool = False
+    dry_run: bool = True
+
+
+# Snapshots keyed by (path, st_mtime_ns); a touched file gets a new key.
+_SNAPSHOT_CACHE: dict[tuple[str, int], RiskConfigSnapshot] = {}
+
+_DEFAULT_SNAPSHOT = RiskConfigSnapshot()
+
+
+class Breach:
+    """Slotted record of one rule breach."""
+
+    __slots__ = ('rule', 'rule_config')
+
+    def __init__(self, rule: str, rule_config: Dict[str, Any]):
+        self.rule = rule
+        self.rule_config = rule_config
+
+
+class EventResult:
+    """Slotted, pool-recycled result of one process_event call.
+
+    At order-fill rates a fresh dict-of-lists per event dominates
+    allocator traffic; these objects are reset in place and reused via
+    RuleEngine's result pool instead.
+    """
+
+    __slots__ = ('event_type', 'rules_checked', 'breaches', 'actions_taken')
+
+    def __init__(self):
+        self.event_type = ''
+        self.rules_checked = 0
+        self.breaches: List[Breach] = []
+        self.actions_taken: List[Dict[str, Any]] = []
+
+    def _reset(self, event_type: str) -> None:
+        self.event_type = event_type
+        self.rules_checked = 0
+        self.breaches.clear()
+        self.actions_taken.clear()
+
+
+_RESULT_POOL_MAX = 8
+
+# Event types the engine actually evaluates; O(1) hashed membership
+# with no per-call list construction in the guards below.
+_HANDLED_EVENTS: frozenset = frozenset(('position_updated', 'order_filled'))
+
+# Hot-path log messages hoisted to interned module constants: the
+# multi-byte emoji literals are built/encoded once per process, and the
+# logging module's %-formatting stays fully lazy at the call sites.
+_MSG_PROCESSING = sys.intern("🏗️ RuleEngine processing %s event through %d active rules")
+_MSG_RECV_POSITION = sys.intern("🔍 RiskEventHandler received position_updated event")
+_MSG_RECV_ORDER = sys.intern("🔍 RiskEventHandler received order_filled event")
+_MSG_SIZE_CHECK = sys.intern("📏 Position size check: %s = %s contracts")
+_MSG_EVAL = sys.intern("⚖️ Risk rules evaluated: %d rules checked, %d breaches found")
+_MSG_BREACH_BLOCK = sys.intern("🚨 RISK BREACHES DETECTED: %d rules triggered\n%s")
+_MSG_RULE_LINE = sys.intern("   Rule: %s | Config: %s")
+_MSG_AUTO_FLATTEN = sys.intern("💥 AUTO-FLATTEN ENABLED: Attempting to close position for %s")
+
+
+class EventView:
+    """Slotted, normalized view of an incoming event.
+
+    Handlers normalize once at the boundary and read plain attributes,
+    instead of re-probing dict/object/event.data shapes with
+    isinstance/hasattr ladders at every use site.
+    """
+
+    __slots__ = ('size', 'contract_id', 'account_id', 'current_position')
+
+    def __init__(self, size, contract_id, account_id, current_position):
+        self.size = size
+        self.contract_id = contract_id
+        self.account_id = account_id
+        self.current_position = current_position
+
+
+def _as_mapping(event: Any) -> Dict[str, Any]:
+    """Unified dict view of an event: itself, its .data, or its __dict__."""
+    if isinstance(event, dict):
+        return event
+    d = getattr(event, 'data', None)
+    if isinstance(d, dict):
+        return d
+    return getattr(event, '__dict__', None) or {}
+
+
+def _normalize(event: Any) -> EventView:
+    """Normalize dict, Event-wrapped, and object payloads into an EventView."""
+    d = _as_mapping(event)
+    return EventView(
+        d.get('size', 0),
+        d.get('contractId'),
+        d.get('accountId'),
+        d.get('current_position'),
+    )
+
+
+def _build_snapshot(raw: Dict[str, Any]) -> RiskConfigSnapshot:
+    """Flatten the parsed JSON into a RiskConfigSnapshot."""
+    rules = raw.get("rules", {})
+    mc = rules.get("max_contracts", {})
+    global_cfg = raw.get("global", {})
+    return RiskConfigSnapshot(
+        max_contracts_enabled=bool(mc.get("enabled", False)),
+        max_size=int(mc.get("max_size", 0)),
+        severity=mc.get("severity", "high"),
+        auto_flatten=bool(mc.get("auto_flatten", False)),
+        dry_run=bool(global_cfg.get("dry_run", True)),
+    )
+
+
 class RuleEngine:
     """
     Engine for loading and executing risk management rules.
@@ -25,6 +167,26 @@ class RuleEngine:
     Processes events through all active rules.
     """
 
+    __slots__ = (
+        'config_path',
+        '_trading_suite',
+        'config',
+        '_config_key',
+        'rules',
+        '_rule_checks',
+        '_rule_names',
+        '_rule_auto_flatten',
+        '_rule_stats_snapshot',
+        '_bound_checks',
+        '_bound_ctx',
+        '_result_pool',
+        '_stats_dirty',
+        '_cached_stats_view',
+        '_batch_sizes',
+        '_batch_limits',
+        'stats',
+    )
+
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize the rule engine.
@@ -33,122 +195,313 @@ class RuleEngine:
             config_path: Path to JSON configuration file
         """
         self.config_path = config_path or "config/risk_config.json"
-        self.config = {}
+        self._trading_suite: Any = None
+        # Rule checks with the enforcement context pre-bound; rebuilt
+        # lazily whenever the context or the rule set changes.
+        self._bound_checks: Optional[List[Any]] = None
+        self._bound_ctx: Any = None
+        self.config: RiskConfigSnapshot = _DEFAULT_SNAPSHOT
+        self._config_key: tuple[str, int] | None = None
         self.rules = []
+        # SoA views over self.rules, rebuilt in _initialize_rules: the
+        # hot loop reads bound methods / names / flags from parallel
+        # arrays instead of chasing attributes per rule per event.
+        self._rule_checks: List[Any] = []
+        self._rule_names: tuple = ()
+        self._rule_auto_flatten = np.empty(0, np.bool_)
+        self._rule_stats_snapshot: List[Any] = []
+        self._result_pool: List[EventResult] = []
+        self._stats_dirty = True
+        self._cached_stats_view: Optional[Mapping[str, Any]] = None
+        self._batch_sizes = np.empty(0, np.int64)
+        self._batch_limits = np.empty(0, np.int64)
         self.stats = {
             'events_processed': 0,
             'rules_checked': 0,
             'breaches_detected': 0
         }
 
+    @property
+    def trading_suite(self) -> Any:
+        return self._trading_suite
+
+    @trading_suite.setter
+    def trading_suite(self, suite: Any) -> None:
+        self._trading_suite = suite
+        self._bound_checks = None
+
     async def initialize(self) -> None:
         """Load configuration and initialize rules."""
         await self._load_config()
         await self._initialize_rules()
+        _kernels.warmup()
         logger.info(f"RuleEngine initialized with {len(self.rules)} rules")
 
     async def _load_config(self) -> None:
-        """Load configuration from JSON file."""
+        """Load configuration into an immutable snapshot.
+
+        The parse is keyed by the file's mtime: re-initializing or
+        reloading against an unchanged file reuses the cached
+        RiskConfigSnapshot without touching the JSON parser.
+        """
         try:
-            config_file = Path(self.config_path)
-            if not config_file.exists():
-                logger.warning(f"Config file not found: {self.config_path}, using defaults")
-                self.config = {"rules": {}, "global": {"dry_run": True}}
+            mtime_ns = os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            logger.warning("Config file not found: %s, using defaults", self.config_path)
+            self.config = _DEFAULT_SNAPSHOT
+            self._config_key = None
+            return
+
+        key = (self.config_path, mtime_ns)
+        snapshot = _SNAPSHOT_CACHE.get(key)
+        if snapshot is None:
+            try:
+                raw = Path(self.config_path).read_bytes()
+                parsed = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+                snapshot = _build_snapshot(parsed)
+            except Exception as e:
+                logger.error("Failed to load config: %s", e)
+                self.config = _DEFAULT_SNAPSHOT
+                self._config_key = None
                 return
+            _SNAPSHOT_CACHE[key] = snapshot
+            logger.info("Loaded risk config from %s", self.config_path)
 
-            with open(config_file, 'r') as f:
-                self.config = json.load(f)
-
-            logger.info(f"Loaded risk config from {self.config_path}")
-
-        except Exception as e:
-            logger.error(f"Failed to load config: {e}")
-            self.config = {"rules": {}, "global": {"dry_run": True}}
+        self.config = snapshot
+        self._config_key = key
 
     async def _initialize_rules(self) -> None:
-        """Initialize rule objects from configuration."""
-        rules_config = self.config.get("rules", {})
+        """Initialize rule objects and their SoA views from the config snapshot."""
+        snapshot = self.config
+        self.rules = []
+        checks: List[Any] = []
+        names: List[str] = []
+        auto_flatten_flags: List[bool] = []
 
         # Max Contracts Rule
-        if rules_config.get("max_contracts", {}).get("enabled", False):
+        if snapshot.max_contracts_enabled:
             max_contracts_config = MaxContractsConfig(
-                enabled=rules_config["max_contracts"]["enabled"],
-                max_size=rules_config["max_contracts"]["max_size"],
-                severity=rules_config["max_contracts"]["severity"],
-                auto_flatten=rules_config["max_contracts"].get("auto_flatten", False)
+                enabled=True,
+                max_size=snapshot.max_size,
+                severity=snapshot.severity,
+                auto_flatten=snapshot.auto_flatten,
             )
             rule = MaxContractsRule(max_contracts_config)
             self.rules.append(rule)
-            logger.info(f"Enabled MaxContractsRule: max_size={max_contracts_config.max_size}")
-
-    async def process_event(self, event_type: str, event_data: Any, api_client: Any = None) -> Dict[str, Any]:
+            checks.append(rule.check)
+            names.append(sys.intern(type(rule).__name__))
+            auto_flatten_flags.append(max_contracts_config.auto_flatten)
+            logger.info("Enabled MaxContractsRule: max_size=%d", max_contracts_config.max_size)
+
+        self._rule_checks = checks
+        self._rule_names = tuple(names)
+        self._rule_auto_flatten = np.array(auto_flatten_flags, dtype=np.bool_)
+        # Read-only config snapshots for breach records: static between
+        # reloads, so the breach path references them by index instead
+        # of calling rule.get_stats() per breach. (The live breach_count
+        # is still available via get_stats() for observability readers.)
+        self._rule_stats_snapshot = [
+            MappingProxyType(rule.get_stats()) for rule in self.rules
+        ]
+        self._bound_checks = None
+        # A rebuilt rule set changes what get_stats reports, so the
+        # cached view must not outlive it
+        self._stats_dirty = True
+
+    async def process_event(self, event_type: str, event_data: Any, api_client: Any = None) -> EventResult:
         """
         Process an event through all active rules.
 
+        The returned EventResult comes from a small pool; callers should
+        hand it back via release_result() (in a finally block) once they
+        are done reading it.
+
         Args:
             event_type: Type of event (e.g., 'position_updated')
             event_data: Event data object
             api_client: API client for rule enforcement
 
         Returns:
-            Dict with processing results
+            EventResult with processing results
         """
         self.stats['events_processed'] += 1
-        logger.info(f"🏗️ RuleEngine processing {event_type} event through {len(self.rules)} active rules")
+        self._stats_dirty = True
+        logger.info(_MSG_PROCESSING, event_type, len(self.rules))
 
-        results = {
-            'event_type': event_type,
-            'rules_checked': 0,
-            'breaches': [],
-            'actions_taken': []
-        }
+        results = self._result_pool.pop() if self._result_pool else EventResult()
+        results._reset(event_type)
 
         # Process both position update and order filled events
-        if event_type not in ['position_updated', 'order_filled']:
+        if event_type not in _HANDLED_EVENTS:
             return results
 
-        # Check all rules
-        for rule in self.rules:
-            self.stats['rules_checked'] += 1
-            results['rules_checked'] += 1
+        # Check all rules via the SoA views (bound methods, names and
+        # flags in parallel arrays), with the enforcement context
+        # pre-bound so the hot loop passes a single positional argument
+        ctx = self._trading_suite or api_client
+        checks = self._bound_checks
+        if checks is None or ctx is not self._bound_ctx:
+            checks = self._bound_checks = [
+                functools.partial(check, trading_suite=ctx)
+                for check in self._rule_checks
+            ]
+            self._bound_ctx = ctx
+        n_rules = len(checks)
+        if not n_rules:
+            return results
 
+        self.stats['rules_checked'] += n_rules
+        results.rules_checked += n_rules
+
+        # Dispatch independent rule checks concurrently: I/O-bound rules
+        # overlap, so wall time is the slowest check instead of the sum.
+        # A single rule skips the gather machinery entirely.
+        if n_rules == 1:
             try:
-                # Run rule check - pass trading_suite for auto-flatten functionality
-                rule_passed = await rule.check(event_data, self.trading_suite if hasattr(self, 'trading_suite') else api_client)
-
-                if not rule_passed:
-                    self.stats['breaches_detected'] += 1
-                    breach_info = {
-                        'rule': rule.__class__.__name__,
-                        'rule_config': rule.get_stats()
-                    }
-                    results['breaches'].append(breach_info)
-
-                    # Track actions (auto-flatten would be logged here)
-                    if hasattr(rule, 'config') and rule.config.auto_flatten:
-                        results['actions_taken'].append({
-                            'rule': rule.__class__.__name__,
-                            'action': 'auto_flatten_attempted'
-                        })
+                outcomes: List[Any] = [await checks[0](event_data)]
+            except Exception as e:  # mirror gather's return_exceptions
+                outcomes = [e]
+        else:
+            outcomes = list(await asyncio.gather(
+                *(check(event_data) for check in checks),
+                return_exceptions=True,
+            ))
+
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error("Error processing rule %s: %s", self._rule_names[i], outcome)
+                continue
+
+            if not outcome:
+                self.stats['breaches_detected'] += 1
+                results.breaches.append(
+                    Breach(self._rule_names[i], self._rule_stats_snapshot[i])
+                )
+
+                # Track actions (auto-flatten would be logged here)
+                if self._rule_auto_flatten[i]:
+                    results.actions_taken.append({
+                        'rule': self._rule_names[i],
+                        'action': 'auto_flatten_attempted'
+                    })
+
+        return results
 
+    async def process_event_batch(self, event_type: str, events: List[Any], api_client: Any = None) -> EventResult:
+        """
+        Process a burst of events through all active rules in one sweep.
+
+        Sizes are extracted once per event into a preallocated int64
+        buffer and compared against each rule's limit with a single
+        _kernels.check_batch call; only the breaching indices go through
+        breach handling. Result pooling matches process_event.
+
+        Args:
+            event_type: Type of event shared by the batch
+            events: Events collected within one tick
+            api_client: API client for rule enforcement
+
+        Returns:
+            EventResult covering the whole batch
+        """
+        self.stats['events_processed'] += len(events)
+        self._stats_dirty = True
+
+        results = self._result_pool.pop() if self._result_pool else EventResult()
+        results._reset(event_type)
+
+        if event_type not in _HANDLED_EVENTS or not events:
+            return results
+
+        n = len(events)
+        if self._batch_sizes.size < n:
+            self._batch_sizes = np.empty(n, np.int64)
+            self._batch_limits = np.empty(n, np.int64)
+        sizes = self._batch_sizes[:n]
+        limits = self._batch_limits[:n]
+
+        ctx = self._trading_suite or api_client
+
+        # Extract once; the per-rule sweeps reuse the same data
+        extracted: List[Optional[Dict[str, Any]]] = [None] * n
+        for i, event in enumerate(events):
+            try:
+                data = self.rules[0]._extract_position_data(event) if self.rules else None
             except Exception as e:
-                logger.error(f"Error processing rule {rule.__class__.__name__}: {e}")
+                logger.error(f"Error extracting batched event: {e}")
+                data = None
+            extracted[i] = data
+            sizes[i] = data['size'] if data else 0
+
+        for r, rule in enumerate(self.rules):
+            rule_name = self._rule_names[r]
+            self.stats['rules_checked'] += n
+            results.rules_checked += n
+            limits.fill(rule._max_size)
+            mask = _kernels.check_batch(sizes, limits)
+            if not mask.any():
+                continue
+            breached = False
+            for i in np.nonzero(mask)[0]:
+                data = extracted[i]
+                if data is None:
+                    continue
+                breached = True
+                self.stats['breaches_detected'] += 1
+                try:
+                    await rule._handle_breach(data, ctx)
+                except Exception as e:
+                    logger.error("Error handling batched breach for %s: %s", rule_name, e)
+            if breached:
+                results.breaches.append(
+                    Breach(rule_name, self._rule_stats_snapshot[r])
+                )
+                if self._rule_auto_flatten[r]:
+                    results.actions_taken.append({
+                        'rule': rule_name,
+                        'action': 'auto_flatten_attempted'
+                    })
 
         return results
 
-    def get_stats(self) -> Dict[str, Any]:
-        """Get engine statistics."""
-        return {
-            'engine_stats': self.stats,
+    def release_result(self, result: EventResult) -> None:
+        """Return an EventResult to the pool for reuse."""
+        if len(self._result_pool) < _RESULT_POOL_MAX:
+            self._result_pool.append(result)
+
+    def get_stats(self) -> Mapping[str, Any]:
+        """Get engine statistics.
+
+        Returns a cached read-only view that is only rebuilt after the
+        counters actually change, so monitoring scrapes at 1 Hz don't
+        allocate a fresh dict-of-dicts per call.
+        """
+        if not self._stats_dirty and self._cached_stats_view is not None:
+            return self._cached_stats_view
+
+        self._cached_stats_view = MappingProxyType({
+            'engine_stats': MappingProxyType(dict(self.stats)),
             'rules': [rule.get_stats() for rule in self.rules],
             'config_summary': {
                 'rules_enabled': len(self.rules),
                 'config_file': self.config_path
             }
-        }
+        })
+        self._stats_dirty = False
+        return self._cached_stats_view
 
     async def reload_config(self) -> None:
-        """Reload configuration and reinitialize rules."""
+        """Reload configuration and reinitialize rules.
+
+        A no-op when the config file's mtime is unchanged, so callers
+        can reload aggressively without paying a parse per call.
+        """
+        try:
+            mtime_ns = os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is not None and self._config_key == (self.config_path, mtime_ns):
+            return
         logger.info("Reloading risk configuration...")
         await self._load_config()
         await self._initialize_rules()
@@ -160,6 +513,7 @@ class RuleEngine:
             'rules_checked': 0,
             'breaches_detected': 0
         }
+        self._stats_dirty = True
         logger.info("RuleEngine stats reset")
 
 
@@ -171,6 +525,8 @@ class RiskEventHandler:
     Can be registered with TradingSuite event listeners.
     """
 
+    __slots__ = ('rule_engine', 'trading_suite', 'api_client')
+
     def __init__(self, rule_engine: RuleEngine, trading_suite: Any = None):
         self.rule_engine = rule_engine
         self.trading_suite = trading_suite
@@ -178,149 +534,108 @@ class RiskEventHandler:
 
     async def on_position_updated(self, event: Any) -> None:
         """Handle position update events and run risk rules."""
-        logger.info("🔍 RiskEventHandler received position_updated event")
-
-        # Add detailed logging of the event data
-        logger.debug(f"📊 Event data type: {type(event)}")
-        if hasattr(event, 'data'):
-            logger.debug(f"📊 Event.data: {event.data}")
-        else:
-            logger.debug(f"📊 Event object: {event}")
-
-        # Extract position size for immediate visibility
-        try:
-            if isinstance(event, dict) and 'size' in event:
-                size = event.get('size', 0)
-                contract = event.get('contractId', 'unknown')
-                logger.info(f"📏 Position size check: {contract} = {size} contracts")
-            elif hasattr(event, 'data') and isinstance(event.data, dict):
-                size = event.data.get('size', 0)
-                contract = event.data.get('contractId', 'unknown')
-                logger.info(f"📏 Position size check: {contract} = {size} contracts")
-            elif hasattr(event, 'size'):
-                size = getattr(event, 'size', 0)
-                contract = getattr(event, 'contractId', 'unknown')
-                logger.info(f"📏 Position size check: {contract} = {size} contracts")
+        info_enabled = logger.isEnabledFor(logging.INFO)
+        if info_enabled:
+            logger.info(_MSG_RECV_POSITION)
+
+        # Detailed event dump only when a DEBUG handler will emit it
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📊 Event data type: %s", type(event))
+            if hasattr(event, 'data'):
+                logger.debug("📊 Event.data: %s", event.data)
             else:
-                logger.warning("📏 Could not extract position size from event")
-        except Exception as e:
-            logger.error(f"📏 Error extracting position size: {e}")
+                logger.debug("📊 Event object: %s", event)
 
-        results = await self.rule_engine.process_event('position_updated', event, self.api_client)
+        ev = _normalize(event)
 
-        # Log that rules were checked (even if no breaches)
-        logger.info(f"⚖️ Risk rules evaluated: {results['rules_checked']} rules checked, {len(results['breaches'])} breaches found")
-
-        # Log summary if breaches detected
-        if results['breaches']:
-            logger.warning(
-                f"🚨 RISK BREACHES DETECTED: {len(results['breaches'])} rules triggered"
-            )
+        # Position size for immediate visibility (log-only work, skipped
+        # entirely when INFO is discarded)
+        if info_enabled:
+            logger.info(_MSG_SIZE_CHECK, ev.contract_id or 'unknown', ev.size)
 
-            for breach in results['breaches']:
-                rule_name = breach.get('rule', 'UnknownRule')
-                rule_config = breach.get('rule_config', {})
-
-                logger.warning(
-                    f"   Rule: {rule_name} | "
-                    f"Config: {rule_config}"
-                )
-
-                # Check if auto-flatten is enabled and attempt to close position
-                if rule_config.get('auto_flatten', False):
-                    logger.warning(f"💥 AUTO-FLATTEN ENABLED: Attempting to close position for {rule_name}")
-                    # Auto-flatten logic would go here
-                    try:
-                        # Extract account and contract IDs for closing
-                        account_id = None
-                        contract_id = None
-
-                        if isinstance(event, dict):
-                            account_id = event.get('accountId')
-                            contract_id = event.get('contractId')
-                        elif hasattr(event, 'data') and isinstance(event.data, dict):
-                            account_id = event.data.get('accountId')
-                            contract_id = event.data.get('contractId')
-                        elif hasattr(event, 'accountId') and hasattr(event, 'contractId'):
-                            account_id = event.accountId
-                            contract_id = event.contractId
-
-                        if contract_id and self.trading_suite:
-                            logger.info(f"📞 Calling PositionManager to close position: {contract_id}")
-                            # Use PositionManager's close_position_direct method
-                            result = await self.trading_suite["MNQ"].positions.close_position_direct(contract_id)
-                            logger.info(f"✅ Close position result: {result}")
-                        else:
-                            logger.error(f"❌ Missing contract_id or trading_suite for auto-flatten: contract={contract_id}, suite={self.trading_suite is not None}")
-
-                    except Exception as e:
-                        logger.error(f"❌ Auto-flatten failed: {e}")
-        else:
-            logger.info("✅ No breaches detected - position within limits")
+        results = await self.rule_engine.process_event('position_updated', event, self.api_client)
+        try:
+            await self._handle_breaches(results, ev)
+        finally:
+            self.rule_engine.release_result(results)
 
     async def on_order_filled(self, event: Any) -> None:
         """Handle order filled events and check risk rules immediately after execution."""
-        logger.info("🔍 RiskEventHandler received order_filled event")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_MSG_RECV_ORDER)
+
+        # Detailed event dump only when a DEBUG handler will emit it
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📊 Order event data type: %s", type(event))
+            if hasattr(event, 'data'):
+                logger.debug("📊 Order event.data: %s", event.data)
+            else:
+                logger.debug("📊 Order event object: %s", event)
 
-        # Add detailed logging of the event data
-        logger.debug(f"📊 Order event data type: {type(event)}")
-        if hasattr(event, 'data'):
-            logger.debug(f"📊 Order event.data: {event.data}")
-        else:
-            logger.debug(f"📊 Order event object: {event}")
+        ev = _normalize(event)
 
         # Process risk rules immediately after order execution
         results = await self.rule_engine.process_event('order_filled', event, self.api_client)
+        try:
+            await self._handle_breaches(results, ev)
+        finally:
+            self.rule_engine.release_result(results)
 
-        # Log that rules were checked (even if no breaches)
-        logger.info(f"⚖️ Risk rules evaluated: {results['rules_checked']} rules checked, {len(results['breaches'])} breaches found")
-
-        # Log summary if breaches detected
-        if results['breaches']:
-            logger.warning(
-                f"🚨 RISK BREACHES DETECTED: {len(results['breaches'])} rules triggered"
-            )
-
-            for breach in results['breaches']:
-                rule_name = breach.get('rule', 'UnknownRule')
-                rule_config = breach.get('rule_config', {})
+    async def _handle_breaches(self, results: EventResult, ev: EventView) -> None:
+        """Log rule outcomes and run auto-flatten for any breaches.
 
-                logger.warning(
-                    f"   Rule: {rule_name} | "
-                    f"Config: {rule_config}"
-                )
+        Shared by both event handlers so CPython warms a single code
+        object on the breach path instead of two cold copies. Enriched
+        order_filled events carry the position in ev.current_position;
+        position updates resolve the contract from ev.contract_id.
+        """
+        # Log that rules were checked (even if no breaches)
+        logger.info(_MSG_EVAL, results.rules_checked, len(results.breaches))
+
+        if not results.breaches:
+            logger.info("✅ No breaches detected - within limits")
+            return
+
+        # One multi-line record for the whole breach set: a single trip
+        # through the filter chain and handler lock instead of one per rule
+        logger.warning(
+            _MSG_BREACH_BLOCK,
+            len(results.breaches),
+            "\n".join(
+                _MSG_RULE_LINE % (breach.rule, breach.rule_config)
+                for breach in results.breaches
+            ),
+        )
+
+        for breach in results.breaches:
+            rule_name = breach.rule
+            rule_config = breach.rule_config
+
+            # Check if auto-flatten is enabled and attempt to close position
+            if not rule_config.get('auto_flatten', False):
+                continue
+            logger.warning(_MSG_AUTO_FLATTEN, rule_name)
+            try:
+                current_position = ev.current_position
+                if current_position is not None:
+                    # Position data from the enriched order_filled event
+                    if current_position.get('size', 0) == 0:
+                        logger.warning("⚠️ Position size is 0, no flattening needed")
+                        continue
+                    contract_id = current_position.get('contract', 'unknown')
+                else:
+                    contract_id = ev.contract_id
+
+                if contract_id and self.trading_suite:
+                    logger.info("📞 Calling PositionManager to close position: %s", contract_id)
+                    # Use PositionManager's close_position_direct method
+                    result = await self.trading_suite["MNQ"].positions.close_position_direct(contract_id)
+                    logger.info("✅ Close position result: %s", result)
+                else:
+                    logger.error("❌ Missing contract_id or trading_suite for auto-flatten: contract=%s, suite=%s", contract_id, self.trading_suite is not None)
 
-                # Check if auto-flatten is enabled and attempt to close position
-                if rule_config.get('auto_flatten', False):
-                    logger.warning(f"💥 AUTO-FLATTEN ENABLED: Attempting to close position for {rule_name}")
-                    # Auto-flatten logic would go here
-                    try:
-                        # Extract position data from enriched event for order_filled
-                        current_position = None
-                        if isinstance(event, dict) and 'current_position' in event:
-                            current_position = event['current_position']
-
-                        if current_position and self.trading_suite:
-                            position_size = current_position.get('size', 0)
-                            contract_id = current_position.get('contract', 'unknown')
-
-                            if position_size != 0:
-                                logger.info(f"📞 Calling PositionManager close_position_direct for {contract_id} (position size: {position_size})")
-                                try:
-                                    # Use PositionManager's close_position_direct method
-                                    result = await self.trading_suite["MNQ"].positions.close_position_direct(contract_id)
-                                    logger.info(f"✅ Auto-flatten PositionManager result: {result}")
-                                except Exception as e:
-                                    logger.error(f"❌ PositionManager call failed: {e}")
-                            else:
-                                logger.warning("⚠️ Position size is 0, no flattening needed")
-                        else:
-                            logger.error(f"❌ No position data available for auto-flatten: position={current_position}")
-
-                    except Exception as e:
-                        logger.error(f"❌ Auto-flatten failed: {e}")
-        else:
-            logger.info("✅ No breaches detected - trade within limits")
+            except Exception as e:
+                logger.error("❌ Auto-flatten failed: %s", e)
 
 
 # Example usage
@@ -346,8 +661,9 @@ async def test_rule_engine():
 
     results = await engine.process_event('position_updated', mock_position_event, api_client)
 
-    assert len(results['breaches']) == 1, "Should detect breach"
-    assert results['breaches'][0]['rule'] == 'MaxContractsRule', "Should identify correct rule"
+    assert len(results.breaches) == 1, "Should detect breach"
+    assert results.breaches[0].rule == 'MaxContractsRule', "Should identify correct rule"
+    engine.release_result(results)
 
     # Check stats
     stats = engine.get_stats()
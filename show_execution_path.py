@@ -3,11 +3,7 @@
 Quick Execution Path Display - Shows where risk rules go
 """
 
-print("🎯 RISK RULE EXECUTION PATH")
-print("="*50)
-print()
-print("Where risk rules 'go' and how hooks execute:")
-print()
+import sys
 
 steps = [
     ("🎯 EVENT FIRES", "POSITION_UPDATED event from broker"),
@@ -18,19 +14,31 @@ steps = [
     ("🔄 AUTO-FLATTEN", "_auto_flatten() called"),
     ("🔌 API CALL", "close_position_direct() executes"),
     ("✅ RESULT", "Position closed successfully"),
-    ("🏁 COMPLETION", "auto_flatten_complete hook fires")
+    ("🏁 COMPLETION", "auto_flatten_complete hook fires"),
 ]
 
-for i, (icon, description) in enumerate(steps, 1):
-    print(f"{i}. {icon} → {description}")
+# Whole banner precomputed once so emitting it is a single write instead
+# of a dozen locked print calls; repeated runs in one process reuse it.
+BANNER = "\n".join(
+    [
+        "🎯 RISK RULE EXECUTION PATH",
+        "=" * 50,
+        "",
+        "Where risk rules 'go' and how hooks execute:",
+        "",
+        *(f"{i}. {icon} → {description}" for i, (icon, description) in enumerate(steps, 1)),
+        "",
+        "🎯 EXECUTION FLOW:",
+        "   Event → Rule → Check → Breach → Hook → API → Result",
+        "",
+        "Your 32 risk rules follow this EXACT same path!",
+        "",
+        "📖 Run 'run_execution_tracer.bat' for detailed tracing",
+        "📖 See 'EXECUTION_FLOW_TRACER_README.md' for full docs",
+        "",
+    ]
+) + "\n"
 
-print()
-print("🎯 EXECUTION FLOW:")
-print("   Event → Rule → Check → Breach → Hook → API → Result")
-print()
-print("Your 32 risk rules follow this EXACT same path!")
-print()
-print("📖 Run 'run_execution_tracer.bat' for detailed tracing")
-print("📖 See 'EXECUTION_FLOW_TRACER_README.md' for full docs")
-print()
-input("Press Enter to exit...")
+if __name__ == "__main__":
+    sys.stdout.write(BANNER)
+    input("Press Enter to exit...")